@@ -0,0 +1,37 @@
+import pickle
+import sys
+from pathlib import Path
+
+try:
+    import orjson
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+except ImportError:
+    import json
+
+    def _loads(data: bytes):
+        return json.loads(data)
+
+I18N_DIR = Path(__file__).resolve().parent.parent / "src" / "openclaw_launcher" / "ui" / "i18n"
+# Must match I18nManager.PRECOMPILED_NAME.
+OUTPUT_NAME = "translations.pickle"
+
+
+def main() -> int:
+    translations = {path.stem: _loads(path.read_bytes()) for path in sorted(I18N_DIR.glob("*.json"))}
+    if not translations:
+        print(f"No translation files found in {I18N_DIR}", file=sys.stderr)
+        return 1
+
+    output_path = I18N_DIR / OUTPUT_NAME
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(translations, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(output_path)
+    print(f"Wrote {output_path} ({', '.join(translations)})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
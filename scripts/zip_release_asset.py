@@ -1,8 +1,52 @@
+import hashlib
 import os
 import sys
 import zipfile
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from openclaw_launcher.core.zip_writer import ZipWriter  # noqa: E402
+
+try:
+    # libdeflate's CRC-32 uses the PCLMULQDQ/ARM CRC instructions when present.
+    from deflate import crc32 as _crc32
+except ImportError:
+    from zlib import crc32 as _crc32
+
+# Release assets are built once and downloaded many times, so trade a little
+# CI time for a smaller archive.
+COMPRESS_LEVEL = 9
+
+
+def _digest(path: Path) -> bytes:
+    return hashlib.sha256(path.read_bytes()).digest()
+
+
+def _compress(path: Path) -> tuple[bytes, int, int, int]:
+    """Return (payload, compress_type, crc32, size) for a single file."""
+    data = path.read_bytes()
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    payload = compressor.compress(data) + compressor.flush()
+    if len(payload) >= len(data):
+        # Incompressible content would only grow; store it as-is.
+        return data, zipfile.ZIP_STORED, _crc32(data), len(data)
+    return payload, zipfile.ZIP_DEFLATED, _crc32(data), len(data)
+
+
+def _iter_files(root: Path):
+    """Yield regular files under root using the scandir type cache instead of a stat per entry."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file():
+                    yield Path(entry.path)
+
 
 def main() -> int:
     tag = os.environ.get("GITHUB_REF_NAME")
@@ -22,10 +66,32 @@ def main() -> int:
 
     zip_path = release_dir / f"openclaw-launcher-{tag}-{platform}.zip"
 
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for file_path in source_dir.rglob("*"):
-            if file_path.is_file():
-                zf.write(file_path, file_path.relative_to("dist"))
+    files = sorted(_iter_files(source_dir))
+
+    # Deflate each distinct file content once in a worker process, then append
+    # the finished streams to the archive in order so the output stays
+    # deterministic. Files with identical content reuse the same stream.
+    with ZipWriter(zip_path) as zf, ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        digests = list(pool.map(_digest, files, chunksize=16))
+        counts = Counter(digests)
+        first_paths = {}
+        for file_path, digest in zip(files, digests):
+            first_paths.setdefault(digest, file_path)
+
+        results = pool.map(_compress, first_paths.values(), chunksize=16)
+        shared = {}
+        for file_path, digest in zip(files, digests):
+            result = shared.get(digest)
+            if result is None:
+                result = next(results)
+                if counts[digest] > 1:
+                    shared[digest] = result
+            counts[digest] -= 1
+            if not counts[digest]:
+                # Last copy of this content; don't keep its payload for the rest of the run.
+                shared.pop(digest, None)
+            zinfo = zipfile.ZipInfo.from_file(file_path, file_path.relative_to("dist").as_posix())
+            zf.write_compressed(zinfo, *result)
 
     print(f"Created: {zip_path}")
     return 0
@@ -1,13 +1,22 @@
 import os
-import platform
-import plistlib
-import shlex
-import subprocess
 import sys
 from pathlib import Path
 
 from .config import Config
 
+_IS_MAC = sys.platform == "darwin"
+_IS_WIN = sys.platform.startswith("win")
+_IS_LINUX = sys.platform.startswith("linux")
+
+if _IS_MAC:
+    _PLATFORM = "Darwin"
+elif _IS_WIN:
+    _PLATFORM = "Windows"
+elif _IS_LINUX:
+    _PLATFORM = "Linux"
+else:
+    _PLATFORM = ""
+
 
 class AutoStartManager:
     LAUNCH_AGENT_LABEL = "io.openclaw.launcher"
@@ -15,30 +24,54 @@ class AutoStartManager:
     WINDOWS_VALUE_NAME = "OpenClawLauncher"
     LINUX_DESKTOP_FILE = "openclaw-launcher.desktop"
 
+    # These only depend on process state, so compute them once.
+    _plist_path_cached: Path | None = None
+    _program_arguments_cached: list[str] | None = None
+    _command_line_cached: str | None = None
+    _linux_autostart_path_cached: Path | None = None
+
     @classmethod
     def is_supported(cls) -> bool:
-        return platform.system() in {"Darwin", "Windows", "Linux"}
+        return _IS_MAC or _IS_WIN or _IS_LINUX
 
     @classmethod
     def _platform(cls) -> str:
-        return platform.system()
+        return _PLATFORM
 
     @classmethod
     def _plist_path(cls) -> Path:
-        return Path.home() / "Library" / "LaunchAgents" / f"{cls.LAUNCH_AGENT_LABEL}.plist"
+        if cls._plist_path_cached is None:
+            cls._plist_path_cached = Path.home() / "Library" / "LaunchAgents" / f"{cls.LAUNCH_AGENT_LABEL}.plist"
+        return cls._plist_path_cached
 
     @classmethod
     def _program_arguments(cls) -> list[str]:
-        if getattr(sys, "frozen", False):
-            return [str(Path(sys.executable).resolve())]
-
-        main_script = Path(__file__).resolve().parent.parent / "main.py"
-        return [str(Path(sys.executable).resolve()), str(main_script)]
+        if cls._program_arguments_cached is None:
+            if getattr(sys, "frozen", False):
+                cls._program_arguments_cached = [str(Path(sys.executable).resolve())]
+            else:
+                main_script = Path(__file__).resolve().parent.parent / "main.py"
+                cls._program_arguments_cached = [str(Path(sys.executable).resolve()), str(main_script)]
+        return list(cls._program_arguments_cached)
 
     @classmethod
     def _command_line(cls) -> str:
-        args = cls._program_arguments()
-        return " ".join(shlex.quote(part) for part in args)
+        if cls._command_line_cached is None:
+            import shlex
+
+            args = cls._program_arguments()
+            cls._command_line_cached = " ".join(shlex.quote(part) for part in args)
+        return cls._command_line_cached
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        """Write via a temp file + rename so readers never see a partial file."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
 
     @classmethod
     def _build_plist_content(cls) -> dict:
@@ -54,15 +87,22 @@ class AutoStartManager:
         }
 
     @classmethod
-    def _write_plist(cls) -> Path:
+    def _plist_bytes(cls) -> bytes:
+        import plistlib
+
+        return plistlib.dumps(cls._build_plist_content())
+
+    @classmethod
+    def _write_plist(cls, content: bytes | None = None) -> Path:
         plist_path = cls._plist_path()
         plist_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(plist_path, "wb") as f:
-            plistlib.dump(cls._build_plist_content(), f)
+        cls._atomic_write(plist_path, content if content is not None else cls._plist_bytes())
         return plist_path
 
     @classmethod
     def _bootout(cls):
+        import subprocess
+
         plist_path = cls._plist_path()
         subprocess.run(
             ["launchctl", "bootout", f"gui/{os.getuid()}", str(plist_path)],
@@ -73,6 +113,8 @@ class AutoStartManager:
 
     @classmethod
     def _bootstrap(cls, plist_path: Path):
+        import subprocess
+
         result = subprocess.run(
             ["launchctl", "bootstrap", f"gui/{os.getuid()}", str(plist_path)],
             capture_output=True,
@@ -86,9 +128,29 @@ class AutoStartManager:
     def _set_enabled_macos(cls, enabled: bool):
         plist_path = cls._plist_path()
         if enabled:
-            plist_path = cls._write_plist()
-            cls._bootout()
-            cls._bootstrap(plist_path)
+            content = cls._plist_bytes()
+            try:
+                if plist_path.read_bytes() == content:
+                    # Already installed with identical content; skip the launchctl round trip.
+                    return
+            except OSError:
+                pass
+
+            plist_path = cls._write_plist(content)
+            try:
+                try:
+                    cls._bootstrap(plist_path)
+                except RuntimeError:
+                    # Most likely already loaded: unload the old definition and retry.
+                    cls._bootout()
+                    cls._bootstrap(plist_path)
+            except Exception:
+                # A plist on disk is taken to mean "loaded" above and by is_enabled; don't leave one behind.
+                try:
+                    plist_path.unlink()
+                except OSError:
+                    pass
+                raise
             return
 
         cls._bootout()
@@ -125,9 +187,11 @@ class AutoStartManager:
 
     @classmethod
     def _linux_autostart_path(cls) -> Path:
-        xdg_config_home = os.environ.get("XDG_CONFIG_HOME")
-        config_home = Path(xdg_config_home).expanduser() if xdg_config_home else (Path.home() / ".config")
-        return config_home / "autostart" / cls.LINUX_DESKTOP_FILE
+        if cls._linux_autostart_path_cached is None:
+            xdg_config_home = os.environ.get("XDG_CONFIG_HOME")
+            config_home = Path(xdg_config_home).expanduser() if xdg_config_home else (Path.home() / ".config")
+            cls._linux_autostart_path_cached = config_home / "autostart" / cls.LINUX_DESKTOP_FILE
+        return cls._linux_autostart_path_cached
 
     @classmethod
     def _linux_desktop_entry(cls) -> str:
@@ -149,7 +213,7 @@ class AutoStartManager:
         desktop_path = cls._linux_autostart_path()
         if enabled:
             desktop_path.parent.mkdir(parents=True, exist_ok=True)
-            desktop_path.write_text(cls._linux_desktop_entry(), encoding="utf-8")
+            cls._atomic_write(desktop_path, cls._linux_desktop_entry().encode("utf-8"))
             return
 
         if desktop_path.exists():
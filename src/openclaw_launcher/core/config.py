@@ -1,7 +1,26 @@
 import os
-import json
+import copy
+import shutil
+import threading
 from pathlib import Path
 
+try:
+    import orjson
+
+    def _loads(raw: bytes):
+        return orjson.loads(raw)
+
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def _loads(raw: bytes):
+        return json.loads(raw)
+
+    def _dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
 class Config:
     """
     Configuration manager for the OpenClaw Launcher.
@@ -13,7 +32,14 @@ class Config:
     LOGS_DIR = BASE_DIR / "logs"
     print(f"Base Dir: {BASE_DIR}")
     CONFIG_FILE = BASE_DIR / "config.json"
-    
+    # Trees being deleted in the background are renamed into here first.
+    TRASH_DIR = BASE_DIR / ".trash"
+
+    _cache: dict | None = None
+    _cache_mtime: int = -1
+    _lock = threading.Lock()
+    _dirs_ready: bool = False
+
     @classmethod
     def get_language(cls) -> str:
         """Get the current language setting."""
@@ -25,41 +51,75 @@ class Config:
         cls.set_setting("language", lang)
 
     @classmethod
-    def get_setting(cls, key: str, default=None):
-        """Get a setting value."""
-        if cls.CONFIG_FILE.exists():
+    def _load_settings(cls) -> dict:
+        """Return the parsed config, re-reading it only when the file's mtime changes."""
+        try:
+            mtime = cls.CONFIG_FILE.stat().st_mtime_ns
+        except OSError:
+            cls._cache = None
+            cls._cache_mtime = -1
+            return {}
+
+        if cls._cache is None or mtime != cls._cache_mtime:
             try:
-                with open(cls.CONFIG_FILE, 'r') as f:
-                    data = json.load(f)
-                    return data.get(key, default)
+                with open(cls.CONFIG_FILE, 'rb') as f:
+                    data = _loads(f.read())
             except Exception:
-                pass
-        return default
+                data = {}
+            cls._cache = data if isinstance(data, dict) else {}
+            cls._cache_mtime = mtime
+        return cls._cache
+
+    @classmethod
+    def get_setting(cls, key: str, default=None):
+        """Get a setting value."""
+        with cls._lock:
+            value = cls._load_settings().get(key, default)
+        # Hand out copies of containers so callers can't mutate the cache.
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
+
+    @classmethod
+    def get_settings_snapshot(cls) -> dict:
+        """Get a copy of all settings, for callers that read many keys at once."""
+        with cls._lock:
+            return copy.deepcopy(cls._load_settings())
 
     @classmethod
     def set_setting(cls, key: str, value):
         """Save a setting value."""
-        data = {}
-        if cls.CONFIG_FILE.exists():
-            try:
-                with open(cls.CONFIG_FILE, 'r') as f:
-                    data = json.load(f)
-            except Exception:
-                pass
-        
-        data[key] = value
-        
-        # Ensure base dir exists
-        cls.BASE_DIR.mkdir(parents=True, exist_ok=True)
-        
-        with open(cls.CONFIG_FILE, 'w') as f:
-            json.dump(data, f, indent=4)
+        cls.set_settings({key: value})
+
+    @classmethod
+    def set_settings(cls, updates: dict):
+        """Save several setting values with a single write."""
+        with cls._lock:
+            data = dict(cls._load_settings())
+            for key, value in updates.items():
+                data[key] = copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+            # Ensure base dir exists
+            cls.BASE_DIR.mkdir(parents=True, exist_ok=True)
+
+            with open(cls.CONFIG_FILE, 'wb') as f:
+                f.write(_dumps(data))
+
+            cls._cache = data
+            cls._cache_mtime = cls.CONFIG_FILE.stat().st_mtime_ns
 
     @classmethod
     def ensure_dirs(cls):
-        """Ensure necessary directories exist."""
+        """Ensure necessary directories exist (once per process)."""
+        if cls._dirs_ready:
+            return
         cls.INSTANCES_DIR.mkdir(parents=True, exist_ok=True)
         cls.LOGS_DIR.mkdir(parents=True, exist_ok=True)
+        cls._dirs_ready = True
+
+        # Sweep trash left behind if a previous run exited before its cleanup finished.
+        if cls.TRASH_DIR.exists():
+            threading.Thread(target=shutil.rmtree, args=(cls.TRASH_DIR,), kwargs={"ignore_errors": True}, daemon=True).start()
 
     @classmethod
     def get_instance_path(cls, instance_name: str) -> Path:
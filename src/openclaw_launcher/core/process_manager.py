@@ -5,12 +5,27 @@ import os
 import time
 import shutil
 import platform
+import re
 import shlex
-from typing import Dict, Optional, IO
+import select
+from functools import lru_cache
+from typing import Dict, Optional, IO, Tuple
 from pathlib import Path
 from .config import Config
 from .install_manager import InstallManager
 
+_SYSTEM = platform.system()
+_IS_WIN = os.name == "nt"
+
+# \w matches the same Unicode letters/digits as str.isalnum(), plus "_".
+_UNSAFE_NAME_CHARS_RE = re.compile(r"[^\w-]")
+
+
+@lru_cache(maxsize=256)
+def _safe_name(instance_name: str) -> str:
+    return _UNSAFE_NAME_CHARS_RE.sub("_", instance_name)
+
+
 class ProcessManager:
     """
     Manages running OpenClaw instances.
@@ -18,32 +33,139 @@ class ProcessManager:
     """
     _instances: Dict[str, subprocess.Popen] = {}
     _logs: Dict[str, IO] = {}
+    _MANAGED_ENV_KEYS = frozenset({
+        "PATH",
+        "npm_config_registry",
+        "NPM_CONFIG_REGISTRY",
+        "pnpm_config_registry",
+        "PNPM_CONFIG_REGISTRY",
+        "COREPACK_NPM_REGISTRY",
+        "NODEJS_ORG_MIRROR",
+        "NVM_NODEJS_ORG_MIRROR",
+        "COREPACK_ENABLE_DOWNLOAD_PROMPT",
+        "COREPACK_INTEGRITY_KEYS",
+        "CI",
+    })
+    # (instance name, instance path) -> .env.local (mtime_ns, size) right after our last setup
+    _env_fingerprints: Dict[Tuple[str, str], Tuple[int, int]] = {}
+    # Script directories already created during this process
+    _ensured_dirs: set = set()
+    # Tried in order; "{source_cmd}" / "{script_cmd}" are filled in per launch.
+    _TERMINAL_TEMPLATES = (
+        ("x-terminal-emulator", "-e", "{script_cmd}"),
+        ("gnome-terminal", "--", "bash", "-lc", "{source_cmd}"),
+        ("konsole", "-e", "bash", "-lc", "{source_cmd}"),
+        ("xfce4-terminal", "-e", "{script_cmd}"),
+        ("xterm", "-e", "bash", "-lc", "{source_cmd}"),
+    )
+    # (PATH, first available terminal template) detected for that PATH
+    _linux_terminal: Optional[Tuple[str, Tuple[str, ...]]] = None
+
+    @staticmethod
+    def _wait_for_exit(process: subprocess.Popen, timeout: float) -> bool:
+        """Wait up to timeout seconds for process to exit; return True once it has been reaped."""
+        if process.poll() is not None:
+            return True
+        if hasattr(os, "pidfd_open"):
+            try:
+                fd = os.pidfd_open(process.pid)
+            except OSError:
+                # Already reaped, or the kernel predates pidfd (Linux < 5.3).
+                fd = None
+            if fd is not None:
+                try:
+                    # poll() rather than select(), which rejects fds >= FD_SETSIZE (1024).
+                    poller = select.poll()
+                    poller.register(fd, select.POLLIN)
+                    poller.poll(timeout * 1000)
+                except (OSError, ValueError):
+                    pass
+                else:
+                    return process.poll() is not None
+                finally:
+                    os.close(fd)
+        try:
+            process.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+
+    @classmethod
+    def _ensure_dir(cls, path: Path):
+        if path not in cls._ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            cls._ensured_dirs.add(path)
+
+    @classmethod
+    def _prepare_instance_env(cls, instance_name: str, instance_path: Path) -> dict:
+        """Run setup_instance_environment only if .env.local changed since we last wrote it."""
+        key = (instance_name, str(instance_path))
+        env_file = instance_path / ".env.local"
+        try:
+            st = os.stat(env_file)
+            fingerprint = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            fingerprint = None
+
+        if fingerprint is None or cls._env_fingerprints.get(key) != fingerprint:
+            InstallManager.setup_instance_environment(instance_path, instance_name)
+            try:
+                st = os.stat(env_file)
+                cls._env_fingerprints[key] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                cls._env_fingerprints.pop(key, None)
+
+        # get_runtime_env is itself cached, and still tracks launcher setting changes.
+        return InstallManager.get_runtime_env(instance_path=instance_path, instance_name=instance_name)
 
     @classmethod
     def _should_export_env_key(cls, key: str) -> bool:
-        managed_keys = {
-            "PATH",
-            "npm_config_registry",
-            "NPM_CONFIG_REGISTRY",
-            "pnpm_config_registry",
-            "PNPM_CONFIG_REGISTRY",
-            "COREPACK_NPM_REGISTRY",
-            "NODEJS_ORG_MIRROR",
-            "NVM_NODEJS_ORG_MIRROR",
-            "COREPACK_ENABLE_DOWNLOAD_PROMPT",
-            "COREPACK_INTEGRITY_KEYS",
-            "CI",
-        }
-        return key in managed_keys or key.startswith("OPENCLAW_") or key.startswith("CLAWDBOT_")
+        return key in cls._MANAGED_ENV_KEYS or key.startswith(("OPENCLAW_", "CLAWDBOT_"))
+
+    @staticmethod
+    def _write_script(path: Path, content: str, executable: bool = False) -> bool:
+        """Write a generated script unless it already holds exactly this content."""
+        data = content.encode("utf-8")
+        existed = True
+        try:
+            if path.read_bytes() == data:
+                return False
+        except FileNotFoundError:
+            existed = False
+        except OSError:
+            pass
+
+        # Creating with the final mode up front saves a stat + chmod on new files.
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        mode = 0o755 if executable else 0o666
+        try:
+            fd = os.open(path, flags, mode)
+        except FileNotFoundError:
+            # The remembered directory was removed from under us; recreate it.
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, flags, mode)
+            existed = False
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if executable and existed:
+                # O_CREAT's mode only applies to new files.
+                current = os.fstat(fd).st_mode
+                if current & 0o111 != 0o111:
+                    os.fchmod(fd, current | 0o111)
+        finally:
+            os.close(fd)
+        return True
 
     @classmethod
     def _ensure_cli_openclaw_shim(cls, instance_name: str, instance_path: Path, node_cmd: str) -> Path:
         script_dir = Config.LOGS_DIR / "_cli_scripts"
         shim_dir = script_dir / "_bin"
-        shim_dir.mkdir(parents=True, exist_ok=True)
+        cls._ensure_dir(shim_dir)
 
-        safe_name = "".join(ch if ch.isalnum() or ch in {"-", "_"} else "_" for ch in instance_name)
-        if os.name == "nt":
+        safe_name = _safe_name(instance_name)
+        if _IS_WIN:
             shim_path = shim_dir / f"openclaw_{safe_name}.cmd"
             shim_lines = [
                 "@echo off",
@@ -52,7 +174,7 @@ class ProcessManager:
                 f'"{node_cmd}" openclaw.mjs %*',
                 "exit /b %errorlevel%",
             ]
-            shim_path.write_text("\r\n".join(shim_lines) + "\r\n", encoding="utf-8")
+            cls._write_script(shim_path, "\r\n".join(shim_lines) + "\r\n")
 
             active_shim = shim_dir / "openclaw.cmd"
             active_lines = [
@@ -60,7 +182,7 @@ class ProcessManager:
                 f'call "{shim_path}" %*',
                 "exit /b %errorlevel%",
             ]
-            active_shim.write_text("\r\n".join(active_lines) + "\r\n", encoding="utf-8")
+            cls._write_script(active_shim, "\r\n".join(active_lines) + "\r\n")
             return shim_dir
 
         shim_path = shim_dir / f"openclaw_{safe_name}"
@@ -70,8 +192,7 @@ class ProcessManager:
             f"cd {shlex.quote(str(instance_path))} || exit 1",
             f"exec {shlex.quote(node_cmd)} openclaw.mjs \"$@\"",
         ]
-        shim_path.write_text("\n".join(shim_lines) + "\n", encoding="utf-8")
-        shim_path.chmod(shim_path.stat().st_mode | 0o111)
+        cls._write_script(shim_path, "\n".join(shim_lines) + "\n", executable=True)
 
         active_shim = shim_dir / "openclaw"
         active_lines = [
@@ -79,8 +200,7 @@ class ProcessManager:
             "set +e",
             f"exec {shlex.quote(str(shim_path))} \"$@\"",
         ]
-        active_shim.write_text("\n".join(active_lines) + "\n", encoding="utf-8")
-        active_shim.chmod(active_shim.stat().st_mode | 0o111)
+        cls._write_script(active_shim, "\n".join(active_lines) + "\n", executable=True)
 
         return shim_dir
 
@@ -93,23 +213,29 @@ class ProcessManager:
         initial_command: Optional[list[str]] = None,
     ) -> Path:
         script_dir = Config.LOGS_DIR / "_cli_scripts"
-        script_dir.mkdir(parents=True, exist_ok=True)
+        cls._ensure_dir(script_dir)
         node_cmd = InstallManager.resolve_runtime_tool(env, "node")
         cli_shim_dir = cls._ensure_cli_openclaw_shim(instance_name, instance_path, node_cmd)
         env["PATH"] = f"{cli_shim_dir}{os.pathsep}{env.get('PATH', '')}"
 
-        safe_name = "".join(ch if ch.isalnum() or ch in {"-", "_"} else "_" for ch in instance_name)
-        if os.name == "nt":
+        exported = [
+            (key, str(value))
+            for key, value in sorted(env.items())
+            if cls._should_export_env_key(key)
+        ]
+
+        safe_name = _safe_name(instance_name)
+        if _IS_WIN:
             script_path = script_dir / f"{safe_name}_launcher.cmd"
             lines = [
                 "@echo off",
                 f'cd /d "{instance_path}"',
                 f"title OpenClaw CLI - {instance_name}",
             ]
-            for key in sorted(env.keys()):
-                if cls._should_export_env_key(key):
-                    value = str(env.get(key, "")).replace('"', '""')
-                    lines.append(f'set "{key}={value}"')
+            for key, value in exported:
+                if '"' in value:
+                    value = value.replace('"', '""')
+                lines.append(f'set "{key}={value}"')
             lines.extend(
                 [
                     f"echo OpenClaw instance CLI ready: {instance_name}",
@@ -119,7 +245,7 @@ class ProcessManager:
             if initial_command:
                 command_line = subprocess.list2cmdline([str(part) for part in initial_command])
                 lines.append(command_line)
-            script_path.write_text("\r\n".join(lines) + "\r\n", encoding="utf-8")
+            cls._write_script(script_path, "\r\n".join(lines) + "\r\n")
             return script_path
 
         script_path = script_dir / f"{safe_name}_launcher.sh"
@@ -128,10 +254,7 @@ class ProcessManager:
             "set +e",
             f"cd {shlex.quote(str(instance_path))} || exit 1",
         ]
-        for key in sorted(env.keys()):
-            if cls._should_export_env_key(key):
-                value = str(env.get(key, ""))
-                lines.append(f"export {key}={shlex.quote(value)}")
+        lines.extend(f"export {key}={shlex.quote(value)}" for key, value in exported)
 
         lines.extend(
             [
@@ -144,51 +267,56 @@ class ProcessManager:
             cmd = " ".join(shlex.quote(str(part)) for part in initial_command)
             lines.append(cmd)
         lines.append("exec \"${SHELL:-/bin/bash}\" -i")
-        script_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-        script_path.chmod(script_path.stat().st_mode | 0o111)
+        cls._write_script(script_path, "\n".join(lines) + "\n", executable=True)
         return script_path
 
     @classmethod
-    def launch_instance_cli(cls, instance_name: str, instance_path: Path):
-        if not instance_path.exists() or not instance_path.is_dir():
-            raise FileNotFoundError(f"Instance directory not found: {instance_path}")
+    def _detect_linux_terminal(cls) -> Optional[Tuple[str, ...]]:
+        path = os.environ.get("PATH", "")
+        if cls._linux_terminal is not None and cls._linux_terminal[0] == path:
+            return cls._linux_terminal[1]
 
-        InstallManager.setup_instance_environment(instance_path, instance_name)
-        env = InstallManager.get_runtime_env(instance_path=instance_path, instance_name=instance_name)
-        script_path = cls._build_cli_script(instance_name, instance_path, env)
+        for template in cls._TERMINAL_TEMPLATES:
+            if shutil.which(template[0], path=path):
+                cls._linux_terminal = (path, template)
+                return template
+        return None
 
-        system = platform.system()
-        if system == "Darwin":
+    @classmethod
+    def _open_cli_terminal(cls, script_path: Path):
+        if _SYSTEM == "Darwin":
             subprocess.Popen(["open", "-a", "Terminal", str(script_path)])
             return
 
-        if system == "Windows":
-            subprocess.Popen(["cmd", "/c", "start", "", "cmd", "/k", str(script_path)])
+        if _SYSTEM == "Windows":
+            # One cmd.exe in its own console window, without the "start" trampoline shell.
+            subprocess.Popen(["cmd.exe", "/k", str(script_path)], creationflags=subprocess.CREATE_NEW_CONSOLE)
             return
 
-        script_cmd = f"bash -lc 'source {shlex.quote(str(script_path))}'"
-        terminal_commands = [
-            ["x-terminal-emulator", "-e", script_cmd],
-            ["gnome-terminal", "--", "bash", "-lc", f"source {shlex.quote(str(script_path))}"],
-            ["konsole", "-e", "bash", "-lc", f"source {shlex.quote(str(script_path))}"],
-            ["xfce4-terminal", "-e", script_cmd],
-            ["xterm", "-e", "bash", "-lc", f"source {shlex.quote(str(script_path))}"],
-        ]
+        template = cls._detect_linux_terminal()
+        if template is None:
+            raise RuntimeError("No supported terminal emulator found for launching instance CLI.")
+
+        source_cmd = f"source {shlex.quote(str(script_path))}"
+        script_cmd = f"bash -lc '{source_cmd}'"
+        subprocess.Popen([part.format(source_cmd=source_cmd, script_cmd=script_cmd) for part in template])
+
+    @classmethod
+    def launch_instance_cli(cls, instance_name: str, instance_path: Path):
+        if not instance_path.exists() or not instance_path.is_dir():
+            raise FileNotFoundError(f"Instance directory not found: {instance_path}")
 
-        for command in terminal_commands:
-            if shutil.which(command[0]):
-                subprocess.Popen(command)
-                return
+        env = cls._prepare_instance_env(instance_name, instance_path)
+        script_path = cls._build_cli_script(instance_name, instance_path, env)
 
-        raise RuntimeError("No supported terminal emulator found for launching instance CLI.")
+        cls._open_cli_terminal(script_path)
 
     @classmethod
     def launch_instance_onboard_cli(cls, instance_name: str, instance_path: Path):
         if not instance_path.exists() or not instance_path.is_dir():
             raise FileNotFoundError(f"Instance directory not found: {instance_path}")
 
-        InstallManager.setup_instance_environment(instance_path, instance_name)
-        env = InstallManager.get_runtime_env(instance_path=instance_path, instance_name=instance_name)
+        env = cls._prepare_instance_env(instance_name, instance_path)
         node_cmd = InstallManager.resolve_runtime_tool(env, "node")
         script_path = cls._build_cli_script(
             instance_name,
@@ -197,30 +325,7 @@ class ProcessManager:
             initial_command=[node_cmd, "openclaw.mjs", "onboard"],
         )
 
-        system = platform.system()
-        if system == "Darwin":
-            subprocess.Popen(["open", "-a", "Terminal", str(script_path)])
-            return
-
-        if system == "Windows":
-            subprocess.Popen(["cmd", "/c", "start", "", "cmd", "/k", str(script_path)])
-            return
-
-        script_cmd = f"bash -lc 'source {shlex.quote(str(script_path))}'"
-        terminal_commands = [
-            ["x-terminal-emulator", "-e", script_cmd],
-            ["gnome-terminal", "--", "bash", "-lc", f"source {shlex.quote(str(script_path))}"],
-            ["konsole", "-e", "bash", "-lc", f"source {shlex.quote(str(script_path))}"],
-            ["xfce4-terminal", "-e", script_cmd],
-            ["xterm", "-e", "bash", "-lc", f"source {shlex.quote(str(script_path))}"],
-        ]
-
-        for command in terminal_commands:
-            if shutil.which(command[0]):
-                subprocess.Popen(command)
-                return
-
-        raise RuntimeError("No supported terminal emulator found for launching instance CLI.")
+        cls._open_cli_terminal(script_path)
 
     @classmethod
     def start_instance(cls, instance_name: str, instance_path: Path):
@@ -236,8 +341,7 @@ class ProcessManager:
         log_file = open(log_file_path, "a", encoding="utf-8", buffering=1)
         
         # Prepare environment
-        InstallManager.setup_instance_environment(instance_path, instance_name)
-        env = InstallManager.get_runtime_env(instance_path=instance_path, instance_name=instance_name)
+        env = cls._prepare_instance_env(instance_name, instance_path)
         instance_port = InstallManager.get_instance_port(instance_path)
 
         node_cmd = InstallManager.resolve_runtime_tool(env, "node")
@@ -251,15 +355,20 @@ class ProcessManager:
             "--allow-unconfigured",
         ]
 
-        log_file.write("\n===== Instance runtime started =====\n")
-        log_file.write(f"cwd: {instance_path}\n")
-        log_file.write(f"command: {' '.join(command)}\n")
-        log_file.write(f"runtime node bin: {env.get('OPENCLAW_RUNTIME_NODE_BIN', '')}\n")
-        log_file.write(f"runtime uv bin: {env.get('OPENCLAW_RUNTIME_UV_BIN', '')}\n")
-        log_file.write(f"runtime python bin: {env.get('OPENCLAW_RUNTIME_PYTHON_BIN', '')}\n")
-        path_preview = env.get("PATH", "")
-        log_file.write(f"PATH preview: {path_preview[:600]}\n")
-        log_file.flush()
+        if Config.get_setting("verbose_logs", True):
+            command_line = " ".join(command)
+            path_preview = env.get("PATH", "")
+            # One write instead of one line-buffered syscall per line.
+            log_file.write(
+                "\n===== Instance runtime started =====\n"
+                f"cwd: {instance_path}\n"
+                f"command: {command_line}\n"
+                f"runtime node bin: {env.get('OPENCLAW_RUNTIME_NODE_BIN', '')}\n"
+                f"runtime uv bin: {env.get('OPENCLAW_RUNTIME_UV_BIN', '')}\n"
+                f"runtime python bin: {env.get('OPENCLAW_RUNTIME_PYTHON_BIN', '')}\n"
+                f"PATH preview: {path_preview[:600]}\n"
+            )
+            log_file.flush()
         
         # Launch process
         popen_kwargs = {
@@ -271,7 +380,7 @@ class ProcessManager:
             "text": True,
             "bufsize": 1,
         }
-        if os.name == "nt":
+        if _IS_WIN:
             popen_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
             startupinfo = subprocess.STARTUPINFO()
             startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
@@ -294,9 +403,7 @@ class ProcessManager:
         process = cls._instances.get(instance_name)
         if process and process.poll() is None:
             process.terminate()
-            try:
-                process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
+            if not cls._wait_for_exit(process, 5):
                 process.kill()
             
         if instance_name in cls._logs:
@@ -311,6 +418,10 @@ class ProcessManager:
         if instance_name in cls._instances:
             del cls._instances[instance_name]
 
+        # Re-run environment setup on the next start so reconfiguration is picked up.
+        for key in [key for key in cls._env_fingerprints if key[0] == instance_name]:
+            del cls._env_fingerprints[key]
+
     @classmethod
     def get_status(cls, instance_name: str) -> str:
         """Get status of an instance."""
@@ -334,6 +445,24 @@ class ProcessManager:
     @classmethod
     def stop_all_instances(cls):
         """Stop all running instances and close all log handles."""
+        # Signal every process first so they shut down in parallel under one shared deadline.
+        running = []
+        for process in list(cls._instances.values()):
+            if process.poll() is None:
+                try:
+                    process.terminate()
+                except OSError:
+                    continue
+                running.append(process)
+
+        deadline = time.monotonic() + 5
+        for process in running:
+            if not cls._wait_for_exit(process, max(0.0, deadline - time.monotonic())):
+                try:
+                    process.kill()
+                except OSError:
+                    pass
+
         for instance_name in list(cls._instances.keys()):
             try:
                 cls.stop_instance(instance_name)
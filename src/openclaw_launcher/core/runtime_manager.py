@@ -1,21 +1,184 @@
 import os
+import base64
+import http.client
 import json
 import logging
 import platform
+import re
 import shutil
 import tarfile
 import zipfile
+import urllib.error
 import urllib.request
 import urllib.parse
 import ssl
+import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from .config import Config
 
+try:
+    # Frozen builds may not see the system trust store; certifi ships with requests.
+    import certifi
+except ImportError:
+    certifi = None
+
+try:
+    import orjson
+
+    def _loads(raw: bytes):
+        return orjson.loads(raw)
+
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data)
+except ImportError:
+    def _loads(raw: bytes):
+        return json.loads(raw)
+
+    def _dumps(data) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
 logger = logging.getLogger(__name__)
 
+# pigz inflates in its own process (with separate read/write/check threads), off our GIL.
+_PIGZ = shutil.which("pigz")
+# tarfile copies member payloads in 16 KiB writes by default; 1 MiB cuts write() calls ~64x.
+_TAR_COPY_BUFSIZE = 1024 * 1024
+# Regular files up to this size are read into memory and written by a small pool,
+# so decompression keeps running while the disk catches up. Bigger ones are written inline.
+_TAR_WRITE_WORKERS = 4
+_TAR_MAX_PENDING_WRITES = 32
+_TAR_POOLED_WRITE_MAX = 8 * 1024 * 1024
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Download progress is reported at most this often (20 Hz); each report is a cross-thread Qt signal.
+_PROGRESS_MIN_INTERVAL = 0.05
+
+_OPENCLAW_TAGS_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    refs(refPrefix: "refs/tags/", first: 20, orderBy: {field: TAG_COMMIT_DATE, direction: DESC}) {
+      nodes {
+        name
+        target {
+          ... on Commit { committedDate }
+          ... on Tag { target { ... on Commit { committedDate } } }
+        }
+      }
+    }
+  }
+}
+"""
+
+_DIGITS_RE = re.compile(r"\d+")
+
+
+@lru_cache(maxsize=2)
+def _ssl_context(insecure: bool) -> ssl.SSLContext:
+    """One shared context per mode, so OpenSSL state and the TLS session cache are reused."""
+    if insecure:
+        return ssl._create_unverified_context()
+    if certifi is not None:
+        return ssl.create_default_context(cafile=certifi.where())
+    return ssl.create_default_context()
+
+
+@lru_cache(maxsize=512)
+def _natural_version_key(version: str) -> tuple:
+    if version == "main":
+        return (1, 0)
+
+    parts = _DIGITS_RE.findall(version)
+    if not parts:
+        return (0, 0)
+    return (0, *map(int, parts))
+
+
+class _ProgressReader:
+    """Minimal read-only file wrapper that reports how many bytes have been consumed, at most every _PROGRESS_MIN_INTERVAL."""
+
+    def __init__(self, raw, on_progress):
+        self._raw = raw
+        self._on_progress = on_progress
+        self._done = 0
+        self._last_report = 0.0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._raw.read(size)
+        if chunk:
+            self._done += len(chunk)
+            now = time.monotonic()
+            if now - self._last_report >= _PROGRESS_MIN_INTERVAL:
+                self._last_report = now
+                self._on_progress(self._done)
+        return chunk
+
+    def flush_progress(self):
+        """Report the final byte count, which throttling may have skipped."""
+        if self._done:
+            self._on_progress(self._done)
+
+
+class _KeepAliveHttps:
+    """Persistent HTTPS connections to one host, one per calling thread, honouring the https proxy."""
+
+    def __init__(self, host: str, context: ssl.SSLContext, timeout: float = 20):
+        self._host = host
+        self._context = context
+        self._timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        proxy = urllib.request.getproxies().get("https")
+        self._proxy = urllib.parse.urlsplit(proxy) if proxy and not urllib.request.proxy_bypass(host) else None
+
+    def _connect(self) -> http.client.HTTPSConnection:
+        if self._proxy is None:
+            conn = http.client.HTTPSConnection(self._host, context=self._context, timeout=self._timeout)
+        else:
+            conn = http.client.HTTPSConnection(
+                self._proxy.hostname,
+                self._proxy.port or (443 if self._proxy.scheme == "https" else 80),
+                context=self._context,
+                timeout=self._timeout,
+            )
+            tunnel_headers = {}
+            if self._proxy.username:
+                credentials = f"{urllib.parse.unquote(self._proxy.username)}:{urllib.parse.unquote(self._proxy.password or '')}"
+                tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+            conn.set_tunnel(self._host, headers=tunnel_headers)
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def get(self, path: str, headers: Dict[str, str]):
+        """Return (status, headers, body), reconnecting once if the server dropped the idle connection."""
+        for attempt in range(2):
+            conn = getattr(self._local, "conn", None)
+            if conn is None:
+                conn = self._local.conn = self._connect()
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                return response.status, response.headers, response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                self._local.conn = None
+                if attempt:
+                    raise
+
+    def close(self):
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+
 class RuntimeManager:
     """
     Manages the resulting runtime downloads and installations.
@@ -29,6 +192,12 @@ class RuntimeManager:
     SOFTWARE_OPENCLAW = "openclaw"
     OPENCLAW_VERSIONS_CONFIG_KEY = "openclaw_available_versions"
     OPENCLAW_VERSIONS_REFRESHED_AT_CONFIG_KEY = "openclaw_available_versions_refreshed_at"
+    OPENCLAW_VERSIONS_ETAG_CONFIG_KEY = "openclaw_available_versions_etag"
+    # Non-forced refreshes within this many seconds of the last one reuse the cached list.
+    REMOTE_VERSIONS_TTL = 3600
+
+    # software -> (RUNTIME_BASE_DIR st_mtime_ns, installed versions), shared by all instances
+    _installed_cache: Dict[str, tuple] = {}
 
     def __init__(self):
         self.ensure_dirs()
@@ -36,6 +205,7 @@ class RuntimeManager:
         self._arch = platform.machine().lower()
         self._remote_versions_cache: Dict[str, List[Dict]] = {}
         self._remote_versions_refreshed_at: Dict[str, str] = {}
+        self._openclaw_tags_etag = ""
         # Mapping definitions
         self._available_versions = {
             self.SOFTWARE_PYTHON: [
@@ -54,10 +224,8 @@ class RuntimeManager:
 
         self._remote_versions_cache[self.SOFTWARE_OPENCLAW] = self._load_cached_openclaw_versions()
         refreshed_at = Config.get_setting(self.OPENCLAW_VERSIONS_REFRESHED_AT_CONFIG_KEY, "")
-        if isinstance(refreshed_at, str):
-            refreshed_at = refreshed_at.strip()
-            if refreshed_at:
-                self._remote_versions_refreshed_at[self.SOFTWARE_OPENCLAW] = refreshed_at
+        if isinstance(refreshed_at, str) and (refreshed_at := refreshed_at.strip()):
+            self._remote_versions_refreshed_at[self.SOFTWARE_OPENCLAW] = refreshed_at
 
     def _load_cached_openclaw_versions(self) -> List[Dict]:
         value = Config.get_setting(self.OPENCLAW_VERSIONS_CONFIG_KEY, [])
@@ -96,28 +264,9 @@ class RuntimeManager:
         return f"default_runtime_{software}"
 
     def _natural_version_key(self, version: str):
-        if version == "main":
-            return (1, 0)
-
-        parts = []
-        token = ""
-        for ch in str(version):
-            if ch.isdigit():
-                token += ch
-            else:
-                if token:
-                    parts.append(int(token))
-                    token = ""
-        if token:
-            parts.append(int(token))
-
-        if not parts:
-            return (0, 0)
-        return (0, *parts)
+        return _natural_version_key(str(version))
 
     def _get_github_proxy(self) -> str:
-        from .config import Config
-
         proxy = Config.get_setting("github_proxy", "")
         if not isinstance(proxy, str):
             return ""
@@ -135,8 +284,6 @@ class RuntimeManager:
         return f"{proxy}{url[len(prefix):]}"
 
     def _get_node_mirror(self) -> str:
-        from .config import Config
-
         mirror = Config.get_setting("node_mirror", "")
         if not isinstance(mirror, str):
             return ""
@@ -204,9 +351,25 @@ class RuntimeManager:
         return ""
 
     def get_installed_versions(self, software: str) -> List[Dict]:
+        try:
+            dir_mtime = self.RUNTIME_BASE_DIR.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        cached = RuntimeManager._installed_cache.get(software)
+        if cached is not None and cached[0] == dir_mtime:
+            return [dict(item) for item in cached[1]]
+
+        versions = self._scan_installed_versions(software)
+        RuntimeManager._installed_cache[software] = (dir_mtime, versions)
+        return [dict(item) for item in versions]
+
+    @classmethod
+    def _invalidate_installed_cache(cls):
+        cls._installed_cache.clear()
+
+    def _scan_installed_versions(self, software: str) -> List[Dict]:
         versions = []
-        if not self.RUNTIME_BASE_DIR.exists():
-            return versions
 
         prefix = f"{software}-"
         for item in self.RUNTIME_BASE_DIR.iterdir():
@@ -216,9 +379,8 @@ class RuntimeManager:
                 date_str = "Unknown"
                 if meta_file.exists():
                     try:
-                        with open(meta_file, 'r') as f:
-                            data = json.load(f)
-                            date_str = data.get("date", date_str)
+                        data = _loads(meta_file.read_bytes())
+                        date_str = data.get("date", date_str)
                     except:
                         pass
                 else:
@@ -258,6 +420,15 @@ class RuntimeManager:
             return configured
         return self.get_latest_installed_version(software)
 
+    def get_default_executables(self, softwares: List[str]) -> Dict[str, Path]:
+        """Resolve the default version's executable for several runtimes (scans are served from _installed_cache)."""
+        executables: Dict[str, Path] = {}
+        for software in softwares:
+            version = self.get_default_version(software)
+            if version:
+                executables[software] = self.get_executable_path(software, version)
+        return executables
+
     def set_default_version(self, software: str, version: str):
         normalized = (version or "").strip()
         if not normalized:
@@ -268,22 +439,97 @@ class RuntimeManager:
 
         Config.set_setting(self._runtime_default_key(software), normalized)
 
-    def _fetch_openclaw_versions(self) -> List[Dict]:
+    def _get_ssl_context(self) -> ssl.SSLContext:
+        return _ssl_context(bool(Config.get_setting("insecure_ssl", False)))
+
+    def _get_github_token(self) -> str:
+        token = Config.get_setting("github_token", "") or os.environ.get("GITHUB_TOKEN", "")
+        return token.strip() if isinstance(token, str) else ""
+
+    def _fetch_openclaw_versions_graphql(self, token: str) -> Optional[List[Dict]]:
+        """Tag names and commit dates in one GraphQL round trip; GitHub only serves GraphQL to authenticated clients."""
+        body = _dumps({
+            "query": _OPENCLAW_TAGS_QUERY,
+            "variables": {"owner": "openclaw", "name": "openclaw"},
+        })
+        req = urllib.request.Request(
+            "https://api.github.com/graphql",
+            data=body,
+            headers={
+                "Authorization": f"bearer {token}",
+                "Content-Type": "application/json",
+                "User-Agent": "openclaw-launcher",
+            },
+        )
+        try:
+            context = self._get_ssl_context()
+            with urllib.request.urlopen(req, context=context, timeout=20) as response:
+                payload = _loads(response.read())
+            nodes = payload["data"]["repository"]["refs"]["nodes"]
+        except Exception as e:
+            logger.warning(f"GraphQL tag query failed, falling back to REST: {e}")
+            return None
+
         versions = []
+        for node in nodes:
+            tag = str(node.get("name", "")).strip()
+            if not tag.startswith("v"):
+                continue
+            target = node.get("target") or {}
+            # Annotated tags point at a Tag object whose own target is the commit.
+            raw_date = str(target.get("committedDate") or (target.get("target") or {}).get("committedDate") or "").strip()
+            versions.append({
+                "version": tag,
+                "date": raw_date.split("T", 1)[0] if raw_date else "Unknown",
+                "url": f"https://github.com/openclaw/openclaw/archive/refs/tags/{tag}.zip",
+            })
 
-        def _github_json_get(url: str):
-            context = ssl._create_unverified_context()
-            req = urllib.request.Request(
-                url,
-                headers={"Accept": "application/vnd.github+json", "User-Agent": "openclaw-launcher"},
-            )
-            with urllib.request.urlopen(req, context=context, timeout=20) as response:
-                return json.loads(response.read().decode("utf-8"))
+        versions.sort(key=lambda x: self._natural_version_key(x["version"]), reverse=True)
+        return versions[:10]
+
+    def _fetch_openclaw_versions(self) -> Optional[List[Dict]]:
+        """Fetch the latest OpenClaw tags; returns None when GitHub reports the tag list unchanged."""
+        token = self._get_github_token()
+        if token:
+            versions = self._fetch_openclaw_versions_graphql(token)
+            if versions:
+                logger.info(f"Fetched {len(versions)} OpenClaw tags via GraphQL")
+                return versions
 
-        api_url = "https://api.github.com/repos/openclaw/openclaw/tags?per_page=20"
+        versions = []
+
+        github_api = _KeepAliveHttps("api.github.com", self._get_ssl_context())
+
+        def _github_get(path: str, etag: str = ""):
+            headers = {"Accept": "application/vnd.github+json", "User-Agent": "openclaw-launcher"}
+            if etag:
+                headers["If-None-Match"] = etag
+            status, response_headers, body = github_api.get(path, headers)
+            if status != 200:
+                raise urllib.error.HTTPError(
+                    f"https://api.github.com{path}", status, http.client.responses.get(status, ""), response_headers, None
+                )
+            return _loads(body), response_headers.get("ETag", "")
+
+        def _github_json_get(path: str):
+            return _github_get(path)[0]
+
+        api_path = "/repos/openclaw/openclaw/tags?per_page=20"
+        # Only revalidate when there is a cached list to fall back on.
+        cached_etag = ""
+        if self._remote_versions_cache.get(self.SOFTWARE_OPENCLAW):
+            cached_etag = Config.get_setting(self.OPENCLAW_VERSIONS_ETAG_CONFIG_KEY, "")
+            if not isinstance(cached_etag, str):
+                cached_etag = ""
         try:
-            logger.info(f"Fetching OpenClaw tags from: {api_url}")
-            payload = _github_json_get(api_url)
+            logger.info(f"Fetching OpenClaw tags from: https://api.github.com{api_path}")
+            try:
+                payload, self._openclaw_tags_etag = _github_get(api_path, cached_etag)
+            except urllib.error.HTTPError as http_error:
+                if http_error.code == 304:
+                    logger.info("OpenClaw tags unchanged (304)")
+                    return None
+                raise
 
             candidates = []
             for item in payload:
@@ -299,13 +545,12 @@ class RuntimeManager:
             candidates.sort(key=lambda x: self._natural_version_key(x["version"]), reverse=True)
             candidates = candidates[:10]
 
-            for item in candidates:
+            def _commit_date(item: Dict) -> str:
                 commit_date = "Unknown"
                 sha = item.get("sha", "")
                 if sha:
                     try:
-                        commit_api_url = f"https://api.github.com/repos/openclaw/openclaw/commits/{sha}"
-                        commit_payload = _github_json_get(commit_api_url)
+                        commit_payload = _github_json_get(f"/repos/openclaw/openclaw/commits/{sha}")
                         raw_date = str(commit_payload.get("commit", {}).get("committer", {}).get("date", "")).strip()
                         if "T" in raw_date:
                             commit_date = raw_date.split("T", 1)[0]
@@ -313,7 +558,14 @@ class RuntimeManager:
                             commit_date = raw_date
                     except Exception as commit_error:
                         logger.warning(f"Failed to fetch commit date for {item['version']}: {commit_error}")
+                return commit_date
+
+            # The per-tag lookups are independent, so issue them concurrently; map() keeps the order.
+            # A few workers, each reusing its keep-alive connection, beat one handshake per lookup.
+            with ThreadPoolExecutor(max_workers=max(1, min(4, len(candidates)))) as pool:
+                commit_dates = list(pool.map(_commit_date, candidates))
 
+            for item, commit_date in zip(candidates, commit_dates):
                 versions.append({
                     "version": item["version"],
                     "date": commit_date,
@@ -323,18 +575,40 @@ class RuntimeManager:
             logger.info(f"Fetched {len(versions)} OpenClaw tags")
         except Exception as e:
             logger.warning(f"Failed to fetch OpenClaw tags: {e}")
+        finally:
+            github_api.close()
 
         return versions
 
-    def refresh_available_versions(self, software: str):
+    def _refreshed_recently(self, software: str) -> bool:
+        refreshed_at = self._remote_versions_refreshed_at.get(software)
+        if not refreshed_at:
+            return False
+        try:
+            last = datetime.strptime(refreshed_at, "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            return False
+        return 0 <= (datetime.now() - last).total_seconds() < self.REMOTE_VERSIONS_TTL
+
+    def refresh_available_versions(self, software: str, force: bool = False):
         if software != self.SOFTWARE_OPENCLAW:
             return
 
+        if not force and self._remote_versions_cache.get(software) and self._refreshed_recently(software):
+            return
+
+        self._openclaw_tags_etag = ""
         versions = self._fetch_openclaw_versions()
-        self._remote_versions_cache[software] = versions
+        if versions is None:
+            # 304 Not Modified: the cached list is still current.
+            versions = list(self._remote_versions_cache.get(software, []))
+        else:
+            self._remote_versions_cache[software] = versions
+            self._save_cached_openclaw_versions(versions)
+            if versions:
+                Config.set_setting(self.OPENCLAW_VERSIONS_ETAG_CONFIG_KEY, self._openclaw_tags_etag)
         refreshed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self._remote_versions_refreshed_at[software] = refreshed_at
-        self._save_cached_openclaw_versions(versions)
         Config.set_setting(self.OPENCLAW_VERSIONS_REFRESHED_AT_CONFIG_KEY, refreshed_at)
 
     def get_available_versions_refreshed_at(self, software: str) -> Optional[str]:
@@ -371,74 +645,206 @@ class RuntimeManager:
     def _download_file(self, url: str, dest: Path, callback=None):
         logger.info(f"Downloading {url} to {dest}")
         try:
-             context = ssl._create_unverified_context()
+             context = self._get_ssl_context()
              with urllib.request.urlopen(url, context=context) as response, open(dest, 'wb') as out_file:
                  total_header = response.headers.get("Content-Length")
                  total = int(total_header) if total_header and total_header.isdigit() else None
                  downloaded = 0
                  self._emit_progress(callback, "download", 0, total, f"Downloading {dest.name}")
+                 last_emit = time.monotonic()
 
                  while True:
-                     chunk = response.read(1024 * 256)
+                     chunk = response.read(_DOWNLOAD_CHUNK_SIZE)
                      if not chunk:
                          break
                      out_file.write(chunk)
                      downloaded += len(chunk)
-                     self._emit_progress(callback, "download", downloaded, total, f"Downloading {dest.name}")
+                     now = time.monotonic()
+                     if now - last_emit >= _PROGRESS_MIN_INTERVAL:
+                         last_emit = now
+                         self._emit_progress(callback, "download", downloaded, total, f"Downloading {dest.name}")
+
+                 self._emit_progress(callback, "download", downloaded, total, f"Downloading {dest.name}")
         except AttributeError:
              urllib.request.urlretrieve(url, dest)
              self._emit_progress(callback, "download", 1, 1, f"Downloading {dest.name}")
 
+    def _flatten_extracted(self, temp_extract: Path, dest_dir: Path):
+        items = list(temp_extract.iterdir())
+        if len(items) == 1 and items[0].is_dir():
+            items = list(items[0].iterdir())
+
+        for item in items:
+            dst = dest_dir / item.name
+            try:
+                # temp_extract lives inside dest_dir, so this is a same-filesystem rename
+                # of the whole entry rather than a copy of every file underneath it.
+                os.replace(item, dst)
+                continue
+            except OSError:
+                pass
+
+            # dst already exists as a non-empty directory (or rename is refused): merge by copying.
+            if item.is_dir() and not item.is_symlink():
+                shutil.copytree(item, dst, symlinks=True, dirs_exist_ok=True)
+                shutil.rmtree(item, ignore_errors=True)
+            else:
+                shutil.copy2(item, dst, follow_symlinks=False)
+                try:
+                    item.unlink()
+                except OSError:
+                    pass
+
+    def _extract_tar_members(self, tar: tarfile.TarFile, dest_dir: Path):
+        """Extract a forward-only tar stream, overlapping member reads with file writes."""
+        root = os.path.abspath(dest_dir)
+        pending = threading.BoundedSemaphore(_TAR_MAX_PENDING_WRITES)
+        directories = []
+        hardlinks = []
+        futures = []
+
+        def _write(target: str, data: bytes, mode: int, mtime: float):
+            try:
+                with open(target, "wb") as f:
+                    f.write(data)
+                os.chmod(target, mode)
+                # Keep the archived mtime, like tar.extract; bundled .pyc files are validated against it.
+                os.utime(target, (mtime, mtime))
+            finally:
+                pending.release()
+
+        with ThreadPoolExecutor(max_workers=_TAR_WRITE_WORKERS) as pool:
+            for member in tar:
+                target = os.path.normpath(os.path.join(root, member.name))
+                if os.path.commonpath([root, target]) != root:
+                    raise RuntimeError(f"Refusing to extract {member.name!r} outside {dest_dir}")
+
+                if member.isfile() and member.size <= _TAR_POOLED_WRITE_MAX:
+                    data = tar.extractfile(member).read()
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    pending.acquire()
+                    futures.append(pool.submit(_write, target, data, member.mode & 0o7777, member.mtime))
+                elif member.isdir():
+                    # Permissions are applied at the end, in case the directory is read-only.
+                    tar.extract(member, path=root, set_attrs=False)
+                    directories.append((member, target))
+                elif member.islnk():
+                    # The link target may still be queued for writing.
+                    hardlinks.append(member)
+                else:
+                    tar.extract(member, path=root)
+
+            for future in futures:
+                future.result()
+
+        for member in hardlinks:
+            tar.extract(member, path=root)
+
+        for member, target in reversed(directories):
+            tar.chmod(member, target)
+            tar.utime(member, target)
+
+    def _extract_targz_stream(self, fileobj, dest_dir: Path):
+        """Unpack a forward-only gzip'd tar stream, decompressing through pigz when available."""
+        proc = None
+        if _PIGZ:
+            try:
+                proc = subprocess.Popen([_PIGZ, "-dc"], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            except OSError:
+                proc = None
+
+        if proc is None:
+            with tarfile.open(fileobj=fileobj, mode="r|gz", copybufsize=_TAR_COPY_BUFSIZE) as tar:
+                self._extract_tar_members(tar, dest_dir)
+            return
+
+        feed_errors = []
+
+        def _feed():
+            try:
+                while True:
+                    chunk = fileobj.read(1024 * 256)
+                    if not chunk:
+                        break
+                    proc.stdin.write(chunk)
+            except BrokenPipeError:
+                pass
+            except Exception as e:
+                feed_errors.append(e)
+            finally:
+                try:
+                    proc.stdin.close()
+                except OSError:
+                    pass
+
+        feeder = threading.Thread(target=_feed, daemon=True)
+        feeder.start()
+        try:
+            with tarfile.open(fileobj=proc.stdout, mode="r|", copybufsize=_TAR_COPY_BUFSIZE) as tar:
+                self._extract_tar_members(tar, dest_dir)
+            # tarfile stops at the end-of-archive marker, but pigz may still be writing record
+            # padding; drain it so pigz exits normally instead of dying of SIGPIPE.
+            while proc.stdout.read(_TAR_COPY_BUFSIZE):
+                pass
+        finally:
+            proc.stdout.close()
+            returncode = proc.wait()
+
+        # The tar stream ended, so pigz hit EOF on its input and the feeder is done.
+        feeder.join()
+        if feed_errors:
+            raise feed_errors[0]
+        if returncode != 0:
+            raise RuntimeError(f"pigz exited with status {returncode}")
+
     def _extract_archive(self, archive_path: Path, dest_dir: Path):
         logger.info(f"Extracting {archive_path} to {dest_dir}")
         temp_extract = dest_dir / "_temp_extract"
         temp_extract.mkdir(parents=True, exist_ok=True)
         
         try:
-            if str(archive_path).endswith("tar.gz") or str(archive_path).endswith("tgz"):
-                with tarfile.open(archive_path, "r:gz") as tar:
-                    tar.extractall(path=temp_extract)
-            elif str(archive_path).endswith("zip"):
+            name = archive_path.name
+            if name.endswith((".tar.gz", ".tgz")):
+                with open(archive_path, "rb") as f:
+                    self._extract_targz_stream(f, temp_extract)
+            elif name.endswith(".zip"):
                 with zipfile.ZipFile(archive_path, 'r') as zip_ref:
                     zip_ref.extractall(temp_extract)
-            
-            # Flatten logic with safe copy to handle long paths and cross-device moves
-            def _safe_move(src: Path, dst_dir: Path):
-                dst = dst_dir / src.name
-                # Ensure destination parent exists
-                dst.parent.mkdir(parents=True, exist_ok=True)
-
-                try:
-                    if src.is_dir():
-                        # Use copytree with dirs_exist_ok to merge/overwrite if needed
-                        shutil.copytree(src, dst, dirs_exist_ok=True)
-                        try:
-                            shutil.rmtree(src)
-                        except Exception:
-                            pass
-                    else:
-                        shutil.copy2(src, dst)
-                        try:
-                            src.unlink()
-                        except Exception:
-                            pass
-                except Exception:
-                    # Surface the error so caller can handle/report it
-                    raise
 
-            items = list(temp_extract.iterdir())
-            if len(items) == 1 and items[0].is_dir():
-                source = items[0]
-                for item in source.iterdir():
-                    _safe_move(item, dest_dir)
-            else:
-                for item in temp_extract.iterdir():
-                    _safe_move(item, dest_dir)
+            self._flatten_extracted(temp_extract, dest_dir)
                     
         finally:
             if temp_extract.exists():
                 shutil.rmtree(temp_extract)
 
+    def _stream_extract_targz(self, url: str, dest_dir: Path, callback=None):
+        """Download a .tar.gz and unpack it on the fly, without writing the archive to disk."""
+        logger.info(f"Streaming {url} into {dest_dir}")
+        name = url.rsplit("/", 1)[-1]
+        temp_extract = dest_dir / "_temp_extract"
+        temp_extract.mkdir(parents=True, exist_ok=True)
+
+        try:
+            context = self._get_ssl_context()
+            with urllib.request.urlopen(url, context=context) as response:
+                total_header = response.headers.get("Content-Length")
+                total = int(total_header) if total_header and total_header.isdigit() else None
+                self._emit_progress(callback, "download", 0, total, f"Downloading {name}")
+                reader = _ProgressReader(
+                    response,
+                    lambda done: self._emit_progress(callback, "download", done, total, f"Downloading {name}"),
+                )
+                # The tar stream is read strictly forward, so decompression overlaps the download.
+                self._extract_targz_stream(reader, temp_extract)
+                reader.flush_progress()
+
+            self._emit_progress(callback, "extract", 0, None, f"Extracting {name}")
+            self._flatten_extracted(temp_extract, dest_dir)
+            self._emit_progress(callback, "extract", 1, 1, f"Extracted {name}")
+        finally:
+            if temp_extract.exists():
+                shutil.rmtree(temp_extract)
+
     def install_version(self, software: str, version: str, callback=None):
         target_dir = self.RUNTIME_BASE_DIR / f"{software}-{version}"
         if target_dir.exists():
@@ -451,7 +857,8 @@ class RuntimeManager:
 
         logger.info(f"Installing {software} {version}...")
         self._emit_progress(callback, "prepare", 0, None, f"Preparing {software} {version}")
-        temp_dir = self.RUNTIME_BASE_DIR / "_temp_dl"
+        # Per-install temp dir so concurrent installs never clean up each other's downloads.
+        temp_dir = self.RUNTIME_BASE_DIR / f"_temp_dl-{software}-{version}"
         temp_dir.mkdir(exist_ok=True, parents=True)
         
         try:
@@ -477,21 +884,31 @@ class RuntimeManager:
                     raise ValueError(f"No download URL for {software} {version}")
                 
                 archive_name = url.split("/")[-1]
-                dl_path = temp_dir / archive_name
-                
-                self._download_file(url, dl_path, callback=callback)
-                self._emit_progress(callback, "extract", 0, None, f"Extracting {archive_name}")
-                self._extract_archive(dl_path, target_dir)
-                self._emit_progress(callback, "extract", 1, 1, f"Extracted {archive_name}")
-                dl_path.unlink() # Delete archive
+                if archive_name.endswith((".tar.gz", ".tgz")):
+                    self._stream_extract_targz(url, target_dir, callback=callback)
+                else:
+                    dl_path = temp_dir / archive_name
+
+                    self._download_file(url, dl_path, callback=callback)
+                    self._emit_progress(callback, "extract", 0, None, f"Extracting {archive_name}")
+                    self._extract_archive(dl_path, target_dir)
+                    self._emit_progress(callback, "extract", 1, 1, f"Extracted {archive_name}")
+                    dl_path.unlink() # Delete archive
                 
-            with open(target_dir / "install_info.json", "w") as f:
-                json.dump({
-                    "version": version,
-                    "date": datetime.now().strftime('%Y-%m-%d'),
-                    "timestamp": datetime.now().timestamp(),
-                    "source": "download"
-                }, f)
+            install_info = {
+                "version": version,
+                "date": datetime.now().strftime('%Y-%m-%d'),
+                "timestamp": datetime.now().timestamp(),
+                "source": "download"
+            }
+            if software != self.SOFTWARE_OPENCLAW:
+                executable = next(
+                    (path for path in self._known_executable_paths(software, target_dir) if path.is_file()),
+                    None,
+                ) or self._search_executable_path(software, target_dir)
+                if executable != target_dir:
+                    install_info["executable"] = executable.relative_to(target_dir).as_posix()
+            (target_dir / "install_info.json").write_bytes(_dumps(install_info))
             self._emit_progress(callback, "done", 1, 1, f"Installed {software} {version}")
                 
         except Exception as e:
@@ -500,15 +917,59 @@ class RuntimeManager:
                 shutil.rmtree(target_dir)
             raise e
         finally:
+            # install_info.json lands inside target_dir, which does not bump the base dir mtime.
+            self._invalidate_installed_cache()
             if temp_dir.exists():
                 try:
                     shutil.rmtree(temp_dir)
                 except:
                     pass
 
+    def install_many(self, specs: List[tuple], callback=None):
+        """Install several (software, version) pairs concurrently; raises the first failure after all finish."""
+        if len(specs) <= 1:
+            for software, version in specs:
+                self.install_version(software, version, callback=callback)
+            return
+
+        with ThreadPoolExecutor(max_workers=len(specs)) as pool:
+            futures = [
+                pool.submit(self.install_version, software, version, callback)
+                for software, version in specs
+            ]
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        if errors:
+            raise errors[0]
+
+    def _known_executable_paths(self, software: str, base: Path) -> List[Path]:
+        """Locations of the executable in the standard archive layouts, after one level is flattened."""
+        is_windows = self._os == "windows"
+        if software == self.SOFTWARE_PYTHON:
+            return [base / "python.exe"] if is_windows else [base / "bin" / "python3", base / "bin" / "python"]
+        if software == self.SOFTWARE_NODE:
+            return [base / "node.exe"] if is_windows else [base / "bin" / "node"]
+        if software == self.SOFTWARE_UV:
+            return [base / "uv.exe"] if is_windows else [base / "uv"]
+        return []
+
     def get_executable_path(self, software: str, version: str) -> Path:
         base = self.get_runtime_path(software, version)
-        
+
+        for candidate in self._known_executable_paths(software, base):
+            if candidate.is_file():
+                return candidate
+
+        # Unknown layout: use the location recorded at install time before walking the tree.
+        try:
+            recorded = _loads((base / "install_info.json").read_bytes()).get("executable")
+            if isinstance(recorded, str) and recorded and (base / recorded).is_file():
+                return base / recorded
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        return self._search_executable_path(software, base)
+
+    def _search_executable_path(self, software: str, base: Path) -> Path:
         if software == self.SOFTWARE_PYTHON:
             if platform.system() == "Windows":
                  found = list(base.rglob("python.exe"))
@@ -9,14 +9,22 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-def run_command(cmd: List[str], cwd: Optional[Path] = None, env: Optional[dict] = None, check: bool = True) -> Tuple[int, str, str]:
-    """Run a shell command and return (returncode, stdout, stderr)."""
+def run_command(
+    cmd: List[str],
+    cwd: Optional[Path] = None,
+    env: Optional[dict] = None,
+    check: bool = True,
+) -> Tuple[int, str, str]:
+    """Run a shell command and return (returncode, stdout, stderr).
+
+    An empty or None env inherits the launcher's environment.
+    """
     try:
         logger.info(f"Running command: {' '.join(cmd)} in {cwd or os.getcwd()}")
         result = subprocess.run(
             cmd,
             cwd=cwd,
-            env=env or os.environ.copy(),
+            env=env or None,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
@@ -0,0 +1,157 @@
+import os
+import struct
+import zipfile
+import zlib
+from pathlib import Path
+
+# Writes zip archives whose entries may be compressed ahead of time (e.g. in a pool),
+# which zipfile.ZipFile has no public API for. Only what the launcher needs is
+# supported: regular files, STORED/DEFLATED, Zip64 for large entries and archives.
+
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+_END_RECORD = struct.Struct("<4s4H2LH")
+_ZIP64_END_RECORD = struct.Struct("<4sQ2H2L4Q")
+_ZIP64_END_LOCATOR = struct.Struct("<4sLQL")
+
+_ZIP64_LIMIT = 0xFFFFFFFF
+_ZIP_FILECOUNT_LIMIT = 0xFFFF
+_DEFAULT_VERSION = 20
+_ZIP64_VERSION = 45
+_UTF8_FLAG = 0x800
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def _dos_datetime(date_time) -> tuple[int, int]:
+    year, month, day, hour, minute, second = date_time
+    return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
+
+
+class ZipWriter:
+    """Append file entries to a new zip archive, then write the central directory on close."""
+
+    def __init__(self, path):
+        self._fp = open(path, "wb")
+        self._entries = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._fp.close()
+
+    @staticmethod
+    def _encode_name(zinfo: zipfile.ZipInfo) -> tuple[bytes, int]:
+        try:
+            return zinfo.filename.encode("ascii"), 0
+        except UnicodeEncodeError:
+            return zinfo.filename.encode("utf-8"), _UTF8_FLAG
+
+    def _write_local_header(self, zinfo, compress_type, crc, compress_size, file_size, zip64) -> None:
+        name, flags = self._encode_name(zinfo)
+        dostime, dosdate = _dos_datetime(zinfo.date_time)
+        extra = b""
+        version = _DEFAULT_VERSION
+        if zip64:
+            extra = struct.pack("<HHQQ", 1, 16, file_size, compress_size)
+            compress_size = file_size = _ZIP64_LIMIT
+            version = _ZIP64_VERSION
+        self._fp.write(_LOCAL_HEADER.pack(
+            b"PK\003\004", version, 0, flags, compress_type, dostime, dosdate,
+            crc, compress_size, file_size, len(name), len(extra),
+        ))
+        self._fp.write(name)
+        self._fp.write(extra)
+
+    def write_compressed(self, zinfo: zipfile.ZipInfo, payload: bytes, compress_type: int, crc: int, file_size: int) -> None:
+        """Add an entry whose payload is already in its final (raw DEFLATE or stored) form."""
+        header_offset = self._fp.tell()
+        zip64 = file_size > _ZIP64_LIMIT or len(payload) > _ZIP64_LIMIT
+        self._write_local_header(zinfo, compress_type, crc, len(payload), file_size, zip64)
+        self._fp.write(payload)
+        self._entries.append((zinfo, compress_type, crc, len(payload), file_size, header_offset))
+
+    def write_file(self, zinfo: zipfile.ZipInfo, file_path: Path, compress_type: int, compresslevel: int = zlib.Z_DEFAULT_COMPRESSION) -> None:
+        """Stream a file into the archive without holding it in memory."""
+        header_offset = self._fp.tell()
+        # Sizes are only known afterwards, so reserve Zip64 fields up front for anything near the limit.
+        zip64 = os.path.getsize(file_path) * 1.05 > _ZIP64_LIMIT
+        self._write_local_header(zinfo, compress_type, 0, 0, 0, zip64)
+
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15) if compress_type == zipfile.ZIP_DEFLATED else None
+        crc = file_size = compress_size = 0
+        with open(file_path, "rb") as src:
+            while chunk := src.read(_STREAM_CHUNK_SIZE):
+                crc = zlib.crc32(chunk, crc)
+                file_size += len(chunk)
+                if compressor is not None:
+                    chunk = compressor.compress(chunk)
+                self._fp.write(chunk)
+                compress_size += len(chunk)
+        if compressor is not None:
+            tail = compressor.flush()
+            self._fp.write(tail)
+            compress_size += len(tail)
+
+        if not zip64 and (file_size > _ZIP64_LIMIT or compress_size > _ZIP64_LIMIT):
+            raise RuntimeError(f"{file_path} grew past the zip size limit while being archived")
+        end = self._fp.tell()
+        self._fp.seek(header_offset)
+        self._write_local_header(zinfo, compress_type, crc, compress_size, file_size, zip64)
+        self._fp.seek(end)
+        self._entries.append((zinfo, compress_type, crc, compress_size, file_size, header_offset))
+
+    def close(self) -> None:
+        if self._fp.closed:
+            return
+        try:
+            self._write_central_directory()
+        finally:
+            self._fp.close()
+
+    def _write_central_directory(self) -> None:
+        fp = self._fp
+        start_dir = fp.tell()
+        for zinfo, compress_type, crc, compress_size, file_size, header_offset in self._entries:
+            name, flags = self._encode_name(zinfo)
+            dostime, dosdate = _dos_datetime(zinfo.date_time)
+            zip64_fields = []
+            if file_size > _ZIP64_LIMIT:
+                zip64_fields.append(file_size)
+                file_size = _ZIP64_LIMIT
+            if compress_size > _ZIP64_LIMIT:
+                zip64_fields.append(compress_size)
+                compress_size = _ZIP64_LIMIT
+            if header_offset > _ZIP64_LIMIT:
+                zip64_fields.append(header_offset)
+                header_offset = _ZIP64_LIMIT
+            extra = b""
+            version = _DEFAULT_VERSION
+            if zip64_fields:
+                extra = struct.pack(f"<HH{len(zip64_fields)}Q", 1, 8 * len(zip64_fields), *zip64_fields)
+                version = _ZIP64_VERSION
+            fp.write(_CENTRAL_HEADER.pack(
+                b"PK\001\002", version, zinfo.create_system, version, 0, flags, compress_type,
+                dostime, dosdate, crc, compress_size, file_size, len(name), len(extra), 0, 0, 0,
+                zinfo.external_attr, header_offset,
+            ))
+            fp.write(name)
+            fp.write(extra)
+
+        end_dir = fp.tell()
+        count = len(self._entries)
+        size_dir = end_dir - start_dir
+        if count >= _ZIP_FILECOUNT_LIMIT or start_dir > _ZIP64_LIMIT or size_dir > _ZIP64_LIMIT:
+            fp.write(_ZIP64_END_RECORD.pack(
+                b"PK\006\006", _ZIP64_END_RECORD.size - 12, _ZIP64_VERSION, _ZIP64_VERSION,
+                0, 0, count, count, size_dir, start_dir,
+            ))
+            fp.write(_ZIP64_END_LOCATOR.pack(b"PK\006\007", 0, end_dir, 1))
+        fp.write(_END_RECORD.pack(
+            b"PK\005\006", 0, 0,
+            min(count, _ZIP_FILECOUNT_LIMIT), min(count, _ZIP_FILECOUNT_LIMIT),
+            min(size_dir, _ZIP64_LIMIT), min(start_dir, _ZIP64_LIMIT), 0,
+        ))
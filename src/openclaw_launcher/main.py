@@ -39,16 +39,15 @@ def main():
     theme_manager.initialize(app)
 
     logo_path = _resolve_logo_path()
-    if logo_path:
-        icon = QIcon(logo_path)
-        if not icon.isNull():
-            app.setWindowIcon(icon)
+    icon = QIcon(logo_path) if logo_path else None
+    if icon is not None and icon.isNull():
+        icon = None
+    if icon is not None:
+        app.setWindowIcon(icon)
         
     window = MainWindow()
-    if logo_path:
-        icon = QIcon(logo_path)
-        if not icon.isNull():
-            window.setWindowIcon(icon)
+    if icon is not None:
+        window.setWindowIcon(icon)
     window.show()
     
     sys.exit(app.exec())
@@ -1,14 +1,24 @@
-import json
+import pickle
 from pathlib import Path
 from PySide6.QtCore import QObject, Signal
 from ..core.config import Config
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 class I18nManager(QObject):
     language_changed = Signal(str)
+    # Written by scripts/build_i18n.py for release builds; the json files stay the source of truth.
+    PRECOMPILED_NAME = "translations.pickle"
+    # Rendered strings for the current language; parameterized messages can vary freely, so cap it.
+    TEXT_CACHE_MAX = 1024
 
     def __init__(self):
         super().__init__()
         self._translations = {}
+        self._text_cache = {}
         self._available_languages = []
         self._base_dir = Path(__file__).parent / "i18n"
         self._load_languages()
@@ -19,6 +29,10 @@ class I18nManager(QObject):
                 self._current_lang = "zh"
             elif "en" in self._available_languages:
                 self._current_lang = "en"
+
+        # Only the active language and the English fallback are parsed up front.
+        self._ensure_loaded(self._current_lang)
+        self._ensure_loaded("en")
              
     @property
     def current_lang(self):
@@ -29,28 +43,69 @@ class I18nManager(QObject):
         return self._available_languages
 
     def _load_languages(self):
-        """Load all json files from the i18n directory."""
+        """List the json files in the i18n directory; they are parsed on first use."""
         if not self._base_dir.exists():
             print(f"Warning: i18n directory not found at {self._base_dir}")
             return
             
-        for file_path in self._base_dir.glob("*.json"):
-            lang_code = file_path.stem
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    self._translations[lang_code] = json.load(f)
-                    self._available_languages.append(lang_code)
-            except Exception as e:
-                print(f"Error loading translation for {lang_code}: {e}")
+        json_files = list(self._base_dir.glob("*.json"))
+        self._available_languages = [file_path.stem for file_path in json_files]
+        self._load_precompiled(json_files)
+
+    def _load_precompiled(self, json_files: list[Path]):
+        """Load every locale from the precompiled blob if it is at least as new as the json files."""
+        blob_path = self._base_dir / self.PRECOMPILED_NAME
+        try:
+            blob_mtime = blob_path.stat().st_mtime_ns
+            if any(file_path.stat().st_mtime_ns > blob_mtime for file_path in json_files):
+                return
+            with open(blob_path, "rb") as f:
+                translations = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Error loading precompiled translations: {e}")
+            return
+
+        self._translations.update(translations)
+        self._available_languages = sorted(set(self._available_languages) | set(translations))
+
+    def _ensure_loaded(self, lang_code: str):
+        if lang_code in self._translations or lang_code not in self._available_languages:
+            return
+
+        try:
+            self._translations[lang_code] = _loads((self._base_dir / f"{lang_code}.json").read_bytes())
+        except Exception as e:
+            print(f"Error loading translation for {lang_code}: {e}")
+            self._translations[lang_code] = {}
 
     def set_language(self, lang: str):
         if lang in self._available_languages and lang != self._current_lang:
+            self._ensure_loaded(lang)
             self._current_lang = lang
+            self._text_cache.clear()
             Config.set_language(lang)
             self.language_changed.emit(lang)
 
     def t(self, key: str, **kwargs) -> str:
         """Get translated string."""
+        cache_key = (key, tuple(sorted(kwargs.items()))) if kwargs else key
+        try:
+            return self._text_cache[cache_key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable format argument; render without caching.
+            return self._translate(key, kwargs)
+
+        text = self._translate(key, kwargs)
+        if len(self._text_cache) >= self.TEXT_CACHE_MAX:
+            self._text_cache.clear()
+        self._text_cache[cache_key] = text
+        return text
+
+    def _translate(self, key: str, kwargs: dict) -> str:
         # Try current language
         lang_data = self._translations.get(self._current_lang, {})
         text = lang_data.get(key)
@@ -1,3 +1,5 @@
+import re
+
 from PySide6.QtWidgets import (QMainWindow, QTabWidget, QWidget, QVBoxLayout,
                                QSystemTrayIcon, QMenu, QPushButton, QHBoxLayout, QLabel,
                                QStyle, QApplication, QMessageBox)
@@ -17,6 +19,8 @@ from ..core.runtime_manager import RuntimeManager
 from .i18n import i18n
 from .theme_manager import theme_manager
 
+_VERSION_RE = re.compile(r"\d+")
+
 
 class OpenClawUpdateCheckWorker(QThread):
     result_ready = Signal(str, str)
@@ -25,20 +29,8 @@ class OpenClawUpdateCheckWorker(QThread):
         if not version:
             return (0,)
 
-        normalized = str(version).strip().lstrip("v")
-        parts = []
-        token = ""
-        for ch in normalized:
-            if ch.isdigit():
-                token += ch
-            else:
-                if token:
-                    parts.append(int(token))
-                    token = ""
-        if token:
-            parts.append(int(token))
-
-        return tuple(parts) if parts else (0,)
+        parts = _VERSION_RE.findall(str(version))
+        return tuple(map(int, parts)) if parts else (0,)
 
     def run(self):
         current_version = ""
@@ -51,14 +43,12 @@ class OpenClawUpdateCheckWorker(QThread):
             if available:
                 latest_version = str(available[0].get("version", "")).strip()
 
+            # Only an available update is worth waking the UI thread for.
             if current_version and latest_version and self._parse_version(latest_version) > self._parse_version(current_version):
                 self.result_ready.emit(current_version, latest_version)
-                return
         except Exception:
             pass
 
-        self.result_ready.emit("", "")
-
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -97,28 +87,35 @@ class MainWindow(QMainWindow):
         # Tabs
         self.tabs = QTabWidget()
         
-        # Panels
-        self.onboard_panel = OnboardPanel()
-        self.instance_panel = InstancePanel()
-        self.dependency_panel = DependencyPanel()
-        self.backup_panel = BackupPanel()
-        self.log_panel = LogPanel()
-        self.plugin_panel = PluginPanel()
-        self.advanced_panel = AdvancedPanel()
-        self.ai_model_panel = AIModelPanel()
-
-        self.onboard_panel.dependencies_ready.connect(self.dependency_panel.refresh_all_cards)
-        self.onboard_panel.sample_ready.connect(self.instance_panel.refresh_instances)
+        # Panels: (attribute, class, title key) in tab order. The first two are built up front;
+        # the rest get a placeholder tab and are constructed the first time they are shown.
+        self._tab_specs = (
+            ("onboard_panel", OnboardPanel, "tab_onboard"),
+            ("instance_panel", InstancePanel, "tab_instances"),
+            ("dependency_panel", DependencyPanel, "tab_dependencies"),
+            ("backup_panel", BackupPanel, "tab_backups"),
+            ("log_panel", LogPanel, "tab_logs"),
+            ("plugin_panel", PluginPanel, "tab_plugins"),
+            ("ai_model_panel", AIModelPanel, "tab_ai_model"),
+            ("advanced_panel", AdvancedPanel, "tab_advanced"),
+        )
+        # Built panels that take part in retranslation / shutdown, filled in as panels are created.
+        self._panels_retranslate = []
+        self._panels_shutdown = []
+        eager_panels = {"onboard_panel", "instance_panel"}
+        for attr, panel_cls, title_key in self._tab_specs:
+            if attr in eager_panels:
+                panel = panel_cls()
+                setattr(self, attr, panel)
+                self._register_panel(panel)
+                self.tabs.addTab(panel, i18n.t(title_key))
+            else:
+                setattr(self, attr, None)
+                self.tabs.addTab(QWidget(), i18n.t(title_key))
 
-        # Add Tabs
-        self.tabs.addTab(self.onboard_panel, i18n.t("tab_onboard"))
-        self.tabs.addTab(self.instance_panel, i18n.t("tab_instances"))
-        self.tabs.addTab(self.dependency_panel, i18n.t("tab_dependencies"))
-        self.tabs.addTab(self.backup_panel, i18n.t("tab_backups"))
-        self.tabs.addTab(self.log_panel, i18n.t("tab_logs"))
-        self.tabs.addTab(self.plugin_panel, i18n.t("tab_plugins"))
-        self.tabs.addTab(self.ai_model_panel, i18n.t("tab_ai_model"))
-        self.tabs.addTab(self.advanced_panel, i18n.t("tab_advanced"))
+        self.onboard_panel.dependencies_ready.connect(self._refresh_dependency_cards)
+        self.onboard_panel.sample_ready.connect(self.instance_panel.refresh_instances)
+        self.tabs.currentChanged.connect(self._ensure_panel)
         
         self.layout.addWidget(self.tabs)
         
@@ -134,45 +131,77 @@ class MainWindow(QMainWindow):
             app.aboutToQuit.connect(self.shutdown)
         
         self.update_ui_texts()
-        QTimer.singleShot(0, self._check_openclaw_updates_on_startup)
+        if Config.get_setting("check_updates", True):
+            QTimer.singleShot(0, self._check_openclaw_updates_on_startup)
 
-    def _check_openclaw_updates_on_startup(self):
-        if not Config.get_setting("check_updates", True):
+    def _register_panel(self, panel):
+        if hasattr(panel, "update_ui_texts"):
+            self._panels_retranslate.append(panel)
+        if callable(getattr(panel, "shutdown", None)):
+            self._panels_shutdown.append(panel)
+
+    def _ensure_panel(self, index: int):
+        if not 0 <= index < len(self._tab_specs):
+            return
+        attr, panel_cls, title_key = self._tab_specs[index]
+        if getattr(self, attr) is not None:
             return
 
+        panel = panel_cls()
+        setattr(self, attr, panel)
+        self._register_panel(panel)
+        placeholder = self.tabs.widget(index)
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, panel, i18n.t(title_key))
+            self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+        if placeholder is not None:
+            placeholder.deleteLater()
+
+    def _refresh_dependency_cards(self):
+        # An unbuilt dependency panel reads fresh state when it is first shown.
+        if self.dependency_panel is not None:
+            self.dependency_panel.refresh_all_cards()
+
+    def _check_openclaw_updates_on_startup(self):
         if self._update_check_worker and self._update_check_worker.isRunning():
             return
 
         worker = OpenClawUpdateCheckWorker()
         worker.result_ready.connect(self._on_openclaw_update_check_result)
+        worker.finished.connect(lambda w=worker: self._clear_update_check_worker(w))
         worker.finished.connect(worker.deleteLater)
         self._update_check_worker = worker
         worker.start()
 
     def _on_openclaw_update_check_result(self, current_version: str, latest_version: str):
-        worker = self._update_check_worker
-        if worker and worker.isFinished():
-            self._update_check_worker = None
-
-        if not current_version or not latest_version:
-            return
-
         QMessageBox.information(
             self,
             i18n.t("title_update_available"),
             i18n.t("msg_openclaw_update_available", current=current_version, latest=latest_version),
         )
 
+    def _clear_update_check_worker(self, worker):
+        # Only forget the worker that actually finished, not one started after it.
+        if self._update_check_worker is worker:
+            self._update_check_worker = None
+
     def toggle_language(self):
         new_lang = "zh" if i18n.current_lang == "en" else "en"
         i18n.set_language(new_lang)
 
     def on_language_changed(self, lang):
-        self.update_ui_texts()
-        # Propagate to panels if they have update_ui_texts method
-        for panel in [self.onboard_panel, self.instance_panel, self.dependency_panel, self.backup_panel, self.log_panel, self.plugin_panel, self.ai_model_panel, self.advanced_panel]:
-            if hasattr(panel, 'update_ui_texts'):
+        # Repaint once after every widget has its new text, not once per setText.
+        self.setUpdatesEnabled(False)
+        try:
+            self.update_ui_texts()
+            for panel in self._panels_retranslate:
                 panel.update_ui_texts()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def on_theme_mode_changed(self, mode):
         self.update_theme_button_text()
@@ -203,14 +232,11 @@ class MainWindow(QMainWindow):
         self.update_theme_button_text()
 
         self.lang_btn.setText(i18n.t("lang_switch"))
-        self.tabs.setTabText(0, i18n.t("tab_onboard"))
-        self.tabs.setTabText(1, i18n.t("tab_instances"))
-        self.tabs.setTabText(2, i18n.t("tab_dependencies"))
-        self.tabs.setTabText(3, i18n.t("tab_backups"))
-        self.tabs.setTabText(4, i18n.t("tab_logs"))
-        self.tabs.setTabText(5, i18n.t("tab_plugins"))
-        self.tabs.setTabText(6, i18n.t("tab_ai_model"))
-        self.tabs.setTabText(7, i18n.t("tab_advanced"))
+        for index, (_, _, title_key) in enumerate(self._tab_specs):
+            # Unlike QLabel/QAbstractButton, QTabBar relayouts even when the text is unchanged.
+            text = i18n.t(title_key)
+            if self.tabs.tabText(index) != text:
+                self.tabs.setTabText(index, text)
         if hasattr(self, "tray_icon") and self.tray_icon:
             self.tray_icon.setToolTip(i18n.t("app_title"))
         if hasattr(self, "action_show") and self.action_show:
@@ -267,13 +293,11 @@ class MainWindow(QMainWindow):
             worker.wait(1000)
         self._update_check_worker = None
 
-        for panel in [self.onboard_panel, self.instance_panel, self.dependency_panel, self.backup_panel, self.log_panel, self.plugin_panel, self.ai_model_panel, self.advanced_panel]:
-            shutdown = getattr(panel, "shutdown", None)
-            if callable(shutdown):
-                try:
-                    shutdown()
-                except Exception:
-                    pass
+        for panel in self._panels_shutdown:
+            try:
+                panel.shutdown()
+            except Exception:
+                pass
 
         ProcessManager.stop_all_instances()
 
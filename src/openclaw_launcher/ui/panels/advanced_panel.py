@@ -2,6 +2,7 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QPushButton, QCheckBox, QGroupBox, QScrollArea, QMessageBox
 )
+from PySide6.QtCore import QThread, QTimer, Signal
 from ...core.config import Config
 from ...core.autostart_manager import AutoStartManager
 from ...core.process_manager import ProcessManager
@@ -10,10 +11,127 @@ import shutil
 import os
 import stat
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+def _remove_dir_with_retries(target_dir, retries=5, delay=0.2):
+    def _onerror(func, path, exc_info):
+        try:
+            os.chmod(path, stat.S_IWRITE)
+            func(path)
+        except Exception:
+            pass
+
+    last_error = None
+    for attempt in range(retries):
+        try:
+            if target_dir.exists():
+                shutil.rmtree(target_dir, onerror=_onerror)
+            return
+        except Exception as e:
+            last_error = e
+            if attempt < retries - 1:
+                time.sleep(delay)
+
+    if last_error:
+        raise last_error
+
+
+class ClearWorker(QThread):
+    """Runs one of the troubleshoot clear operations; emits the success message key."""
+    completed = Signal(str)
+    error = Signal(str)
+
+    MODE_DEPENDENCIES = "dependencies"
+    MODE_INSTANCES = "instances"
+    MODE_BACKUPS = "backups"
+
+    def __init__(self, mode: str):
+        super().__init__()
+        self.mode = mode
+
+    def run(self):
+        try:
+            if self.mode == self.MODE_DEPENDENCIES:
+                self._clear_dependencies()
+            elif self.mode == self.MODE_INSTANCES:
+                self._clear_instances()
+            elif self.mode == self.MODE_BACKUPS:
+                self._clear_backups()
+            self.completed.emit(f"msg_clear_{self.mode}_success")
+        except Exception as e:
+            self.error.emit(str(e))
+
+    def _clear_dependencies(self):
+        if not Config.INSTANCES_DIR.exists():
+            return
+
+        dep_dirs = []
+        with os.scandir(Config.INSTANCES_DIR) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                for name in ("node_modules", ".venv"):
+                    dep_dir = Path(entry.path) / name
+                    if dep_dir.exists():
+                        dep_dirs.append(dep_dir)
+        if not dep_dirs:
+            return
+
+        # Deleting many small files is bound by per-file unlink latency, and the trees are
+        # independent, so remove them concurrently. Every tree is attempted before reporting.
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, len(dep_dirs))) as pool:
+            futures = [pool.submit(_remove_dir_with_retries, dep_dir) for dep_dir in dep_dirs]
+        for future in futures:
+            future.result()
+
+    def _clear_instances(self):
+        # The panel stops the instances on the UI thread before starting this worker;
+        # give the OS a moment to release their file handles.
+        time.sleep(0.2)
+        if Config.INSTANCES_DIR.exists():
+            _remove_dir_with_retries(Config.INSTANCES_DIR)
+        Config.INSTANCES_DIR.mkdir(parents=True, exist_ok=True)
+
+    def _clear_backups(self):
+        backup_dir = Config.BASE_DIR / "backups"
+        if backup_dir.exists():
+            _remove_dir_with_retries(backup_dir)
+        backup_dir.mkdir(parents=True, exist_ok=True)
+
+
+class AutoStartProbeWorker(QThread):
+    # True/False when the OS state could be read, None when unsupported or unknown
+    result_ready = Signal(object)
+
+    def run(self):
+        enabled = None
+        if AutoStartManager.is_supported():
+            try:
+                enabled = AutoStartManager.is_enabled()
+            except Exception:
+                enabled = None
+        self.result_ready.emit(enabled)
+
 
 class AdvancedPanel(QWidget):
+    # Read straight from Config by the main window's close/minimize handlers, so never deferred.
+    _IMMEDIATE_SETTINGS = frozenset({"minimize_to_tray"})
+
     def __init__(self):
         super().__init__()
+        self._auto_start_enabled = None
+        self.auto_start_probe_worker = None
+        self.clear_worker = None
+        # Checkbox changes are coalesced and written together shortly after the last toggle.
+        self._pending_settings = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(200)
+        self._flush_timer.timeout.connect(self._flush_settings)
+        # Bumped when the user writes the setting, so an in-flight probe result is dropped.
+        self._auto_start_generation = 0
+        settings = Config.get_settings_snapshot()
         # Use a main layout for the widget itself but containing the ScrollArea
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
@@ -36,7 +154,7 @@ class AdvancedPanel(QWidget):
         self.lbl_close_action = QLabel()
         self.chk_minimize_tray = QCheckBox()
         self.lbl_tray_desc = QLabel()
-        self.lbl_tray_desc.setStyleSheet("color: gray; font-size: 11px;")
+        self.lbl_tray_desc.setProperty("role", "desc")
         
         self.layout_general.addWidget(self.lbl_close_action)
         self.layout_general.addWidget(self.chk_minimize_tray)
@@ -47,7 +165,7 @@ class AdvancedPanel(QWidget):
         self.lbl_check_updates = QLabel()
         self.chk_check_updates = QCheckBox()
         self.lbl_updates_desc = QLabel()
-        self.lbl_updates_desc.setStyleSheet("color: gray; font-size: 11px;")
+        self.lbl_updates_desc.setProperty("role", "desc")
 
         self.layout_general.addWidget(self.lbl_check_updates)
         self.layout_general.addWidget(self.chk_check_updates)
@@ -58,7 +176,7 @@ class AdvancedPanel(QWidget):
         self.lbl_windows_patch = QLabel()
         self.chk_windows_patch = QCheckBox()
         self.lbl_windows_patch_desc = QLabel()
-        self.lbl_windows_patch_desc.setStyleSheet("color: gray; font-size: 11px;")
+        self.lbl_windows_patch_desc.setProperty("role", "desc")
         self.lbl_windows_patch_desc.setWordWrap(True)
 
         self.layout_general.addWidget(self.lbl_windows_patch)
@@ -70,9 +188,9 @@ class AdvancedPanel(QWidget):
         self.lbl_auto_start = QLabel()
         self.chk_auto_start = QCheckBox()
         self.lbl_auto_start_desc = QLabel()
-        self.lbl_auto_start_desc.setStyleSheet("color: gray; font-size: 11px;")
+        self.lbl_auto_start_desc.setProperty("role", "desc")
         self.lbl_auto_start_status = QLabel()
-        self.lbl_auto_start_status.setStyleSheet("color: gray; font-size: 11px;")
+        self.lbl_auto_start_status.setProperty("role", "desc")
         
         self.layout_general.addWidget(self.lbl_auto_start)
         self.layout_general.addWidget(self.chk_auto_start)
@@ -93,18 +211,26 @@ class AdvancedPanel(QWidget):
             lbl = QLabel()
             ipt = QLineEdit()
             # Restore value
-            current_val = Config.get_setting(config_key, default_val)
+            current_val = settings.get(config_key, default_val)
             ipt.setText(current_val)
             
             desc = QLabel()
-            desc.setStyleSheet("color: gray; font-size: 11px;")
+            desc.setProperty("role", "desc")
             desc.setWordWrap(True)
             
             btn_save = QPushButton("Save")
+            status_lbl = QLabel()
+            status_lbl.setProperty("role", "desc")
+            # Restarted on every save, so rapid saves keep the confirmation visible.
+            status_timer = QTimer(self)
+            status_timer.setSingleShot(True)
+            status_timer.setInterval(2000)
+            status_timer.timeout.connect(status_lbl.clear)
             
             row = QHBoxLayout()
             row.addWidget(ipt)
             row.addWidget(btn_save)
+            row.addWidget(status_lbl)
 
             self.layout_sources.addWidget(lbl)
             self.layout_sources.addLayout(row)
@@ -113,7 +239,9 @@ class AdvancedPanel(QWidget):
             
             # Connect save
             # Use default args to capture current key/ipt
-            btn_save.clicked.connect(lambda checked=False, k=config_key, i=ipt: self.save_source(k, i.text()))
+            btn_save.clicked.connect(
+                lambda checked=False, k=config_key, i=ipt, l=status_lbl, t=status_timer: self.save_source(k, i.text(), l, t)
+            )
             
             return lbl, ipt, desc, btn_save, desc_key, label_key
 
@@ -135,7 +263,7 @@ class AdvancedPanel(QWidget):
         self.layout_troubleshoot = QVBoxLayout(self.grp_troubleshoot)
         
         self.lbl_troubleshoot_hint = QLabel()
-        self.lbl_troubleshoot_hint.setStyleSheet("color: orange;")
+        self.lbl_troubleshoot_hint.setProperty("role", "hint")
         self.layout_troubleshoot.addWidget(self.lbl_troubleshoot_hint)
         self.layout_troubleshoot.addSpacing(5)
 
@@ -149,7 +277,7 @@ class AdvancedPanel(QWidget):
         self.layout_troubleshoot.addLayout(row_dependencies)
 
         self.lbl_clear_dependencies_desc = QLabel()
-        self.lbl_clear_dependencies_desc.setStyleSheet("color: gray; font-size: 11px;")
+        self.lbl_clear_dependencies_desc.setProperty("role", "desc")
         self.lbl_clear_dependencies_desc.setWordWrap(True)
         self.layout_troubleshoot.addWidget(self.lbl_clear_dependencies_desc)
 
@@ -186,25 +314,54 @@ class AdvancedPanel(QWidget):
         self.btn_clear_backups.clicked.connect(self.execute_clear_backups)
 
         self.update_ui_texts()
-        self.load_settings()
+        self.load_settings(settings)
+
+    def load_settings(self, settings: dict | None = None):
+        if settings is None:
+            settings = Config.get_settings_snapshot()
+        # Show the saved auto-start value right away; the OS state is probed off the UI thread.
+        for chk, key, default in (
+            (self.chk_minimize_tray, "minimize_to_tray", False),
+            (self.chk_check_updates, "check_updates", True),
+            (self.chk_windows_patch, "windows_a2ui_patch", True),
+            (self.chk_auto_start, "auto_start", False),
+        ):
+            # Loading must not echo the values back into Config.
+            chk.blockSignals(True)
+            chk.setChecked(settings.get(key, default))
+            chk.blockSignals(False)
+        self.refresh_auto_start_status()
+        self._probe_auto_start()
 
-    def load_settings(self):
-        self.chk_minimize_tray.setChecked(Config.get_setting("minimize_to_tray", False))
-        self.chk_check_updates.setChecked(Config.get_setting("check_updates", True))
-        self.chk_windows_patch.setChecked(Config.get_setting("windows_a2ui_patch", True))
-        auto_start_checked = Config.get_setting("auto_start", False)
-        if AutoStartManager.is_supported():
-            try:
-                auto_start_checked = AutoStartManager.is_enabled()
-                Config.set_setting("auto_start", auto_start_checked)
-            except Exception:
-                pass
-        self.chk_auto_start.blockSignals(True)
-        self.chk_auto_start.setChecked(auto_start_checked)
-        self.chk_auto_start.blockSignals(False)
+    def _probe_auto_start(self):
+        if self.auto_start_probe_worker and self.auto_start_probe_worker.isRunning():
+            return
+
+        worker = AutoStartProbeWorker()
+        generation = self._auto_start_generation
+        worker.result_ready.connect(lambda enabled, g=generation: self._on_auto_start_probed(enabled, g))
+        worker.finished.connect(worker.deleteLater)
+        self.auto_start_probe_worker = worker
+        worker.start()
+
+    def _on_auto_start_probed(self, enabled, generation):
+        self.auto_start_probe_worker = None
+        if generation != self._auto_start_generation:
+            return
+        if enabled is not None:
+            self._auto_start_enabled = enabled
+            if Config.get_setting("auto_start", False) != enabled:
+                Config.set_setting("auto_start", enabled)
+            self.chk_auto_start.blockSignals(True)
+            self.chk_auto_start.setChecked(enabled)
+            self.chk_auto_start.blockSignals(False)
         self.refresh_auto_start_status()
 
     def update_ui_texts(self):
+        opt_enabled = i18n.t("opt_enabled")
+        btn_execute = i18n.t("btn_execute")
+        btn_save = i18n.t("btn_save")
+
         # General
         self.grp_general.setTitle(i18n.t("grp_general"))
         self.lbl_close_action.setText(i18n.t("lbl_close_action"))
@@ -212,15 +369,15 @@ class AdvancedPanel(QWidget):
         self.lbl_tray_desc.setText(i18n.t("desc_close_action")) 
 
         self.lbl_check_updates.setText(i18n.t("lbl_check_updates"))
-        self.chk_check_updates.setText(i18n.t("opt_enabled"))
+        self.chk_check_updates.setText(opt_enabled)
         self.lbl_updates_desc.setText(i18n.t("desc_check_updates"))
 
         self.lbl_windows_patch.setText(i18n.t("lbl_windows_patch"))
-        self.chk_windows_patch.setText(i18n.t("opt_enabled"))
+        self.chk_windows_patch.setText(opt_enabled)
         self.lbl_windows_patch_desc.setText(i18n.t("desc_windows_patch"))
 
         self.lbl_auto_start.setText(i18n.t("lbl_auto_start"))
-        self.chk_auto_start.setText(i18n.t("opt_enabled"))
+        self.chk_auto_start.setText(opt_enabled)
         self.lbl_auto_start_desc.setText(i18n.t("desc_auto_start"))
         self.refresh_auto_start_status()
 
@@ -231,7 +388,7 @@ class AdvancedPanel(QWidget):
             lbl, ipt, desc, btn, desc_key, label_key = row_tuple
             lbl.setText(i18n.t(label_key))
             desc.setText(i18n.t(desc_key))
-            btn.setText(i18n.t("btn_save"))
+            btn.setText(btn_save)
         
         update_src_row(self.src_github)
         update_src_row(self.src_pypi)
@@ -242,21 +399,34 @@ class AdvancedPanel(QWidget):
         self.grp_troubleshoot.setTitle(i18n.t("grp_troubleshoot"))
         self.lbl_troubleshoot_hint.setText(i18n.t("lbl_troubleshoot_hint"))
         self.lbl_clear_dependencies.setText(i18n.t("lbl_clear_dependencies"))
-        self.btn_clear_dependencies.setText(i18n.t("btn_execute"))
+        self.btn_clear_dependencies.setText(btn_execute)
         self.lbl_clear_dependencies_desc.setText(i18n.t("desc_clear_dependencies"))
         self.lbl_clear_instances.setText(i18n.t("lbl_clear_instances"))
-        self.btn_clear_instances.setText(i18n.t("btn_execute"))
+        self.btn_clear_instances.setText(btn_execute)
         self.lbl_clear_backups.setText(i18n.t("lbl_clear_backups"))
-        self.btn_clear_backups.setText(i18n.t("btn_execute"))
+        self.btn_clear_backups.setText(btn_execute)
 
     def save_general(self, key, value):
-        Config.set_setting(key, value)
+        self._pending_settings[key] = value
+        if key in self._IMMEDIATE_SETTINGS:
+            self._flush_settings()
+        else:
+            self._flush_timer.start()
+
+    def _flush_settings(self):
+        self._flush_timer.stop()
+        if not self._pending_settings:
+            return
+        pending, self._pending_settings = self._pending_settings, {}
+        Config.set_settings(pending)
 
     def on_auto_start_changed(self):
         value = self.chk_auto_start.isChecked()
+        self._auto_start_generation += 1
         try:
             AutoStartManager.set_enabled(value)
             Config.set_setting("auto_start", value)
+            self._auto_start_enabled = value
             self.refresh_auto_start_status()
         except Exception as e:
             self.chk_auto_start.blockSignals(True)
@@ -266,102 +436,80 @@ class AdvancedPanel(QWidget):
             QMessageBox.critical(self, i18n.t("title_error"), i18n.t("msg_auto_start_failed", error=str(e)))
 
     def refresh_auto_start_status(self):
-        if not AutoStartManager.is_supported():
-            self.lbl_auto_start_status.setText(i18n.t("auto_start_status_unknown"))
-            return
-
-        try:
-            if AutoStartManager.is_enabled():
-                self.lbl_auto_start_status.setText(i18n.t("auto_start_status_enabled"))
-            else:
-                self.lbl_auto_start_status.setText(i18n.t("auto_start_status_disabled"))
-        except Exception:
+        # Reflects the last probed or written state; never touches the OS from the UI thread.
+        if self._auto_start_enabled is None:
             self.lbl_auto_start_status.setText(i18n.t("auto_start_status_unknown"))
+        elif self._auto_start_enabled:
+            self.lbl_auto_start_status.setText(i18n.t("auto_start_status_enabled"))
+        else:
+            self.lbl_auto_start_status.setText(i18n.t("auto_start_status_disabled"))
     
-    def save_source(self, key, value):
+    def save_source(self, key, value, status_lbl, status_timer):
         Config.set_setting(key, value)
-        message = i18n.t("msg_saved_setting").format(key=key)
-        QMessageBox.information(self, i18n.t("title_success"), message)
-
-    def _remove_dir_with_retries(self, target_dir, retries=5, delay=0.2):
-        def _onerror(func, path, exc_info):
-            try:
-                os.chmod(path, stat.S_IWRITE)
-                func(path)
-            except Exception:
-                pass
-
-        last_error = None
-        for attempt in range(retries):
-            try:
-                if target_dir.exists():
-                    shutil.rmtree(target_dir, onerror=_onerror)
-                return
-            except Exception as e:
-                last_error = e
-                if attempt < retries - 1:
-                    time.sleep(delay)
+        status_lbl.setText(i18n.t("msg_saved_inline"))
+        status_timer.start()
 
-        if last_error:
-            raise last_error
-
-    def execute_clear_dependencies(self):
+    def _confirm(self, message_key: str) -> bool:
         reply = QMessageBox.question(
             self,
             i18n.t("title_confirm"),
-            i18n.t("msg_confirm_clear_dependencies"),
+            i18n.t(message_key),
             QMessageBox.Yes | QMessageBox.No,
         )
-        if reply != QMessageBox.Yes:
+        return reply == QMessageBox.Yes
+
+    def _set_clear_buttons_enabled(self, enabled: bool):
+        for btn in (self.btn_clear_dependencies, self.btn_clear_instances, self.btn_clear_backups):
+            btn.setEnabled(enabled)
+
+    def _start_clear(self, mode: str):
+        if self.clear_worker and self.clear_worker.isRunning():
             return
 
-        try:
-            if Config.INSTANCES_DIR.exists():
-                for instance_dir in Config.INSTANCES_DIR.iterdir():
-                    if not instance_dir.is_dir():
-                        continue
-                    for dep_dir in (instance_dir / "node_modules", instance_dir / ".venv"):
-                        if dep_dir.exists():
-                            self._remove_dir_with_retries(dep_dir)
-            QMessageBox.information(self, i18n.t("title_success"), i18n.t("msg_clear_dependencies_success"))
-        except Exception as e:
-            QMessageBox.critical(self, i18n.t("title_error"), i18n.t("msg_operation_failed", error=str(e)))
+        self._set_clear_buttons_enabled(False)
+        worker = ClearWorker(mode)
+        worker.completed.connect(self.on_clear_completed)
+        worker.error.connect(self.on_clear_error)
+        worker.finished.connect(worker.deleteLater)
+        self.clear_worker = worker
+        worker.start()
+
+    def on_clear_completed(self, message_key):
+        self.clear_worker = None
+        self._set_clear_buttons_enabled(True)
+        QMessageBox.information(self, i18n.t("title_success"), i18n.t(message_key))
+
+    def on_clear_error(self, error_msg):
+        self.clear_worker = None
+        self._set_clear_buttons_enabled(True)
+        QMessageBox.critical(self, i18n.t("title_error"), i18n.t("msg_operation_failed", error=error_msg))
+
+    def execute_clear_dependencies(self):
+        if self._confirm("msg_confirm_clear_dependencies"):
+            self._start_clear(ClearWorker.MODE_DEPENDENCIES)
 
     def execute_clear_instances(self):
-        reply = QMessageBox.question(
-            self,
-            i18n.t("title_confirm"),
-            i18n.t("msg_confirm_clear_instances"),
-            QMessageBox.Yes | QMessageBox.No,
-        )
-        if reply != QMessageBox.Yes:
+        if not self._confirm("msg_confirm_clear_instances"):
+            return
+        if self.clear_worker and self.clear_worker.isRunning():
             return
 
+        # ProcessManager's state is owned by the UI thread, so stop instances here, not in the worker.
         try:
             ProcessManager.stop_all_instances()
-            time.sleep(0.2)
-            if Config.INSTANCES_DIR.exists():
-                self._remove_dir_with_retries(Config.INSTANCES_DIR)
-            Config.INSTANCES_DIR.mkdir(parents=True, exist_ok=True)
-            QMessageBox.information(self, i18n.t("title_success"), i18n.t("msg_clear_instances_success"))
         except Exception as e:
             QMessageBox.critical(self, i18n.t("title_error"), i18n.t("msg_operation_failed", error=str(e)))
-
-    def execute_clear_backups(self):
-        reply = QMessageBox.question(
-            self,
-            i18n.t("title_confirm"),
-            i18n.t("msg_confirm_clear_backups"),
-            QMessageBox.Yes | QMessageBox.No,
-        )
-        if reply != QMessageBox.Yes:
             return
+        self._start_clear(ClearWorker.MODE_INSTANCES)
 
-        try:
-            backup_dir = Config.BASE_DIR / "backups"
-            if backup_dir.exists():
-                self._remove_dir_with_retries(backup_dir)
-            backup_dir.mkdir(parents=True, exist_ok=True)
-            QMessageBox.information(self, i18n.t("title_success"), i18n.t("msg_clear_backups_success"))
-        except Exception as e:
-            QMessageBox.critical(self, i18n.t("title_error"), i18n.t("msg_operation_failed", error=str(e)))
+    def execute_clear_backups(self):
+        if self._confirm("msg_confirm_clear_backups"):
+            self._start_clear(ClearWorker.MODE_BACKUPS)
+
+    def shutdown(self):
+        self._flush_settings()
+        for worker_attr in ("auto_start_probe_worker", "clear_worker"):
+            worker = getattr(self, worker_attr, None)
+            if worker and worker.isRunning():
+                worker.wait(2000)
+            setattr(self, worker_attr, None)
@@ -3,14 +3,49 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListWidget, Q
 from PySide6.QtCore import QThread, Signal
 import shutil
 import zipfile
+import zlib
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from ...core.config import Config
 from ...core.install_manager import InstallManager
+from ...core.zip_writer import ZipWriter
 from ..i18n import i18n
 
 
+# Content that does not shrink under DEFLATE is stored as-is.
+_STORED_SUFFIXES = frozenset({
+    ".zip", ".gz", ".tgz", ".xz", ".bz2", ".7z", ".zst",
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".mp3", ".mp4", ".woff", ".woff2",
+})
+_MIN_DEFLATE_SIZE = 1024
+# Larger files are streamed into the archive on the worker thread instead of held in memory.
+_MAX_POOLED_SIZE = 64 * 1024 * 1024
+
+
+def _deflatable(file_path: Path, size: int) -> bool:
+    return size >= _MIN_DEFLATE_SIZE and file_path.suffix.lower() not in _STORED_SUFFIXES
+
+
+def _compress_member(file_path: Path, arcname: str):
+    """Return (zinfo, payload, compress_type, crc32, size), or None if the file should be streamed."""
+    if file_path.stat().st_size > _MAX_POOLED_SIZE:
+        return None
+
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    data = file_path.read_bytes()
+    crc = zlib.crc32(data)
+    if _deflatable(file_path, len(data)):
+        # Raw DEFLATE stream (no zlib header), as stored in zip entries. zlib releases the GIL.
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        payload = compressor.compress(data) + compressor.flush()
+        if len(payload) < len(data):
+            return zinfo, payload, zipfile.ZIP_DEFLATED, crc, len(data)
+    return zinfo, data, zipfile.ZIP_STORED, crc, len(data)
+
+
 class BackupCreateWorker(QThread):
     finished = Signal(str)
     error = Signal(str)
@@ -27,27 +62,55 @@ class BackupCreateWorker(QThread):
             self.progress_percentage.emit(10)
             # Create zip manually to exclude node_modules
             zip_path = str(self.output_file) + '.zip'
-            
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Collect all files to archive
-                files_to_archive = []
-                for root, dirs, files in os.walk(self.source_dir):
-                    # Skip node_modules directories
-                    if 'node_modules' in dirs:
-                        dirs.remove('node_modules')
-                    
-                    for file in files:
-                        file_path = Path(root) / file
-                        files_to_archive.append(file_path)
-                
-                total_files = len(files_to_archive)
-                for idx, file_path in enumerate(files_to_archive):
-                    arcname = file_path.relative_to(self.source_dir)
-                    zipf.write(file_path, arcname)
-                    
+
+            # Collect all files to archive
+            files_to_archive = []
+            for root, dirs, files in os.walk(self.source_dir):
+                # Skip node_modules directories
+                if 'node_modules' in dirs:
+                    dirs.remove('node_modules')
+
+                for file in files:
+                    file_path = Path(root) / file
+                    files_to_archive.append(file_path)
+
+            total_files = len(files_to_archive)
+            workers = max(1, min(os.cpu_count() or 1, total_files))
+            # Files are deflated in parallel but written in order; the window bounds how many
+            # compressed payloads are held in memory at once.
+            pending = deque()
+            remaining = iter(files_to_archive)
+
+            def _submit_next(pool):
+                file_path = next(remaining, None)
+                if file_path is not None:
+                    arcname = file_path.relative_to(self.source_dir).as_posix()
+                    pending.append((file_path, arcname, pool.submit(_compress_member, file_path, arcname)))
+
+            with ZipWriter(zip_path) as zipf, \
+                    ThreadPoolExecutor(max_workers=workers) as pool:
+                for _ in range(workers * 2):
+                    _submit_next(pool)
+
+                done = 0
+                last_progress = 10
+                while pending:
+                    file_path, arcname, future = pending.popleft()
+                    result = future.result()
+                    _submit_next(pool)
+
+                    if result is None:
+                        compress_type = zipfile.ZIP_DEFLATED if _deflatable(file_path, file_path.stat().st_size) else zipfile.ZIP_STORED
+                        zipf.write_file(zipfile.ZipInfo.from_file(file_path, arcname), file_path, compress_type)
+                    else:
+                        zipf.write_compressed(*result)
+
                     # Update progress (10% to 95%)
-                    progress = 10 + int((idx + 1) / total_files * 85)
-                    self.progress_percentage.emit(progress)
+                    done += 1
+                    progress = 10 + int(done / total_files * 85)
+                    if progress != last_progress:
+                        last_progress = progress
+                        self.progress_percentage.emit(progress)
             
             self.progress_percentage.emit(100)
             self.finished.emit(self.instance_name)
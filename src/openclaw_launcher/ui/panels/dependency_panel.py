@@ -246,7 +246,7 @@ class DependencyPanel(QWidget):
         top_layout = QHBoxLayout()
         top_layout.addStretch()
         self.lbl_openclaw_last_refresh = QLabel()
-        self.lbl_openclaw_last_refresh.setStyleSheet("color: gray; font-size: 11px;")
+        self.lbl_openclaw_last_refresh.setProperty("role", "desc")
         top_layout.addWidget(self.lbl_openclaw_last_refresh)
         self.btn_refresh = QPushButton(i18n.t("btn_refresh"))
         self.btn_refresh.clicked.connect(lambda: self.refresh_all_cards(force_remote_refresh=True))
@@ -375,7 +375,7 @@ class DependencyPanel(QWidget):
 
     def refresh_all_cards(self, force_remote_refresh: bool = False):
         if force_remote_refresh:
-            self.runtime_manager.refresh_available_versions(RuntimeManager.SOFTWARE_OPENCLAW)
+            self.runtime_manager.refresh_available_versions(RuntimeManager.SOFTWARE_OPENCLAW, force=True)
         self._update_openclaw_last_refresh_text()
         for card in self.cards:
             card.refresh_ui() # This now handles title update too
@@ -30,34 +30,42 @@ class InstallDependenciesWorker(QThread):
     def run(self):
         try:
             manager = RuntimeManager()
+            installs = []
 
             # Node.js runtime
+            node_target = None
             if not manager.get_default_version(RuntimeManager.SOFTWARE_NODE):
                 node_versions = manager.get_available_versions(RuntimeManager.SOFTWARE_NODE)
                 if not node_versions:
                     raise RuntimeError("No available Node.js versions")
 
                 node_target = str(node_versions[0]["version"])
-                self.progress.emit(i18n.t("onboard_status_installing_dep", name=i18n.t("runtime_node"), version=node_target))
-                self.progress_percentage.emit(25)
-                manager.install_version(RuntimeManager.SOFTWARE_NODE, node_target)
-                self.progress_percentage.emit(50)
-                manager.set_default_version(RuntimeManager.SOFTWARE_NODE, node_target)
+                installs.append((RuntimeManager.SOFTWARE_NODE, node_target))
 
             # OpenClaw runtime
+            openclaw_target = None
             if not manager.get_default_version(RuntimeManager.SOFTWARE_OPENCLAW):
                 self.progress.emit(i18n.t("onboard_status_refresh_openclaw"))
-                self.progress_percentage.emit(60)
+                self.progress_percentage.emit(25)
                 manager.refresh_available_versions(RuntimeManager.SOFTWARE_OPENCLAW)
                 openclaw_versions = manager.get_available_versions(RuntimeManager.SOFTWARE_OPENCLAW)
                 if not openclaw_versions:
                     raise RuntimeError("No available OpenClaw versions")
 
                 openclaw_target = str(openclaw_versions[0]["version"])
-                self.progress.emit(i18n.t("onboard_status_installing_dep", name=i18n.t("runtime_openclaw"), version=openclaw_target))
-                self.progress_percentage.emit(80)
-                manager.install_version(RuntimeManager.SOFTWARE_OPENCLAW, openclaw_target)
+                installs.append((RuntimeManager.SOFTWARE_OPENCLAW, openclaw_target))
+
+            if installs:
+                # Download both runtimes at the same time rather than one after the other.
+                items = ", ".join(f"{i18n.t('runtime_' + software)} {version}" for software, version in installs)
+                self.progress.emit(i18n.t("onboard_status_installing_deps", items=items))
+                self.progress_percentage.emit(50)
+                manager.install_many(installs)
                 self.progress_percentage.emit(95)
+
+            if node_target:
+                manager.set_default_version(RuntimeManager.SOFTWARE_NODE, node_target)
+            if openclaw_target:
                 manager.set_default_version(RuntimeManager.SOFTWARE_OPENCLAW, openclaw_target)
 
             self.progress_percentage.emit(100)
@@ -5,6 +5,13 @@ from ..core.config import Config
 class ThemeManager(QObject):
     theme_mode_changed = Signal(str)
 
+    # App-wide rules for labels tagged with a "role" property, parsed once per theme change
+    # instead of once per widget.
+    EXTRA_STYLESHEET = """
+QLabel[role="desc"] { color: gray; font-size: 11px; }
+QLabel[role="hint"] { color: orange; }
+"""
+
     MODE_LIGHT = "light"
     MODE_DARK = "dark"
     MODE_SYSTEM = "system"
@@ -54,6 +61,10 @@ class ThemeManager(QObject):
         except Exception:
             pass
 
+        stylesheet = self._app.styleSheet()
+        if not stylesheet.endswith(self.EXTRA_STYLESHEET):
+            self._app.setStyleSheet(stylesheet + self.EXTRA_STYLESHEET)
+
     def _resolve_effective_theme(self) -> str:
         if self._mode == self.MODE_LIGHT:
             return self.MODE_LIGHT